@@ -0,0 +1,93 @@
+import pytest
+
+from war_of_the_ring_ai.assets import (
+    ASSET_PATH,
+    COUNT,
+    DATA_DIR,
+    HEADER,
+    SOURCE_FILES,
+    compile_assets,
+    compile_sources,
+    load_assets,
+    read_assets,
+)
+
+
+@pytest.fixture(name="data_dir")
+def fixture_data_dir(tmp_path):
+    for name in SOURCE_FILES:
+        (tmp_path / name).write_bytes((DATA_DIR / name).read_bytes())
+    return tmp_path
+
+
+def test_compiled_assets_match_sources(data_dir):
+    asset_path = data_dir / "assets.bin"
+    compiled = compile_assets(data_dir, asset_path)
+    assert read_assets(data_dir, asset_path) == compiled
+    assert len(compiled.regions) == 105
+    assert len(compiled.cards) == 96
+    assert len(compiled.politics) == 8
+
+
+def test_stale_assets_are_rejected(data_dir):
+    asset_path = data_dir / "assets.bin"
+    assert read_assets(data_dir, asset_path) is None
+    compile_assets(data_dir, asset_path)
+    with open(data_dir / "politics.csv", "a", encoding="utf8") as politics:
+        politics.write("\n")
+    assert read_assets(data_dir, asset_path) is None
+
+
+@pytest.mark.parametrize("size", [HEADER.size + 1, HEADER.size + 64, -1])
+def test_truncated_assets_are_rejected(data_dir, size):
+    asset_path = data_dir / "assets.bin"
+    compile_assets(data_dir, asset_path)
+    # The header and checksum are intact, so only decoding can catch the damage
+    asset_path.write_bytes(asset_path.read_bytes()[:size])
+    assert read_assets(data_dir, asset_path) is None
+
+
+def test_corrupt_assets_are_rejected(data_dir):
+    asset_path = data_dir / "assets.bin"
+    compile_assets(data_dir, asset_path)
+    buffer = asset_path.read_bytes()
+    asset_path.write_bytes(
+        buffer[: HEADER.size] + b"\xff" * (len(buffer) - HEADER.size)
+    )
+    assert read_assets(data_dir, asset_path) is None
+
+
+def test_flipped_distance_is_rejected(data_dir):
+    asset_path = data_dir / "assets.bin"
+    assets = compile_assets(data_dir, asset_path)
+    buffer = bytearray(asset_path.read_bytes())
+    # The distance table ends just before the card and politics arrays, so this is the
+    # last region's distance to itself. The damaged asset still decodes cleanly.
+    tail = COUNT.size + 2 * len(assets.cards) + COUNT.size + 3 * len(assets.politics)
+    buffer[-tail - 1] ^= 1
+    asset_path.write_bytes(buffer)
+    assert read_assets(data_dir, asset_path) is None
+
+
+def test_loading_assets_writes_nothing():
+    data_files = sorted(DATA_DIR.iterdir())
+    asset_existed = ASSET_PATH.exists()
+    load_assets.cache_clear()
+    try:
+        assert load_assets() == compile_sources()
+    finally:
+        load_assets.cache_clear()
+    assert sorted(DATA_DIR.iterdir()) == data_files
+    assert ASSET_PATH.exists() == asset_existed
+
+
+def test_directed_map_is_rejected(data_dir):
+    worldmap = data_dir / "worldmap.csv"
+    rows = worldmap.read_text(encoding="utf8").splitlines()
+    rows = [
+        row.replace("Forlindon|Grey Havens|", "Forlindon|Grey Havens,Harlindon|")
+        for row in rows
+    ]
+    worldmap.write_text("\n".join(rows), encoding="utf8")
+    with pytest.raises(ValueError):
+        compile_sources(data_dir)
@@ -0,0 +1,41 @@
+import asyncio
+
+from war_of_the_ring_ai.agent import delayed_random_strategy
+from war_of_the_ring_ai.async_engine import simulate_async
+from war_of_the_ring_ai.simulate import simulate
+
+
+def outcomes(results):
+    return [(r.game, r.winner, r.turns, r.decisions, r.error) for r in results]
+
+
+def test_async_games_match_sequential_games():
+    strategy = delayed_random_strategy(0)
+    results = asyncio.run(simulate_async(30, strategy, strategy, seed=6, concurrency=7))
+    assert outcomes(results) == outcomes(simulate(30, seed=6))
+
+
+def test_waiting_games_do_not_block_each_other():
+    # Decisions are held until every game is waiting on one at the same time, which
+    # only happens if waiting games let the others move
+    concurrency = 8
+    waiting = 0
+    all_waiting = asyncio.Event()
+
+    async def strategy(request, rng):
+        nonlocal waiting
+        waiting += 1
+        if waiting == concurrency:
+            all_waiting.set()
+        await all_waiting.wait()
+        waiting -= 1
+        return rng.randrange(len(request.options))
+
+    async def play():
+        return await asyncio.wait_for(
+            simulate_async(concurrency, strategy, strategy, 1, concurrency), timeout=60
+        )
+
+    results = asyncio.run(play())
+    assert all_waiting.is_set()
+    assert outcomes(results) == outcomes(simulate(concurrency, seed=1))
@@ -0,0 +1,45 @@
+import io
+
+from war_of_the_ring_ai.agent import Agent, random_strategy
+from war_of_the_ring_ai.decision_log import DecisionLog
+from war_of_the_ring_ai.game_requests import DeclareFellowship, EnterMordor
+
+
+def test_agent_records_decisions():
+    log = DecisionLog()
+    agent = Agent("FREE", lambda request, rng: request.options[1], log)
+    assert agent.response(DeclareFellowship()) is False
+    assert list(log.events) == [(DeclareFellowship, 1, 2)]
+
+
+def test_ring_buffer_keeps_latest_decisions():
+    log = DecisionLog(capacity=3)
+    agent = Agent("FREE", random_strategy, log)
+    for _ in range(5):
+        agent.response(EnterMordor())
+    agent.response(DeclareFellowship())
+    assert len(log.events) == 3
+    assert log.events[-1][0] is DeclareFellowship
+
+
+def test_sink_is_written_in_bulk():
+    sink = io.StringIO()
+    log = DecisionLog(capacity=4, sink=sink)
+    for choice in range(6):
+        log.record(EnterMordor, choice % 2, 2)
+    assert sink.getvalue().splitlines() == ["EnterMordor 0/2", "EnterMordor 1/2"] * 2
+    log.flush()
+    assert len(sink.getvalue().splitlines()) == 6
+    assert not log.events
+
+
+def test_disabled_log_is_not_formatted(monkeypatch):
+    log = DecisionLog()
+    log.record(EnterMordor, 0, 2)
+
+    def fail_format():
+        raise AssertionError("Decisions should not be formatted.")
+
+    monkeypatch.setattr(log, "format", fail_format)
+    log.flush()
+    assert not log.events
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from war_of_the_ring_ai.env import AsyncGameEnv, GameEnv, VectorGameEnv
+from war_of_the_ring_ai.game_manager import GameManager
+from war_of_the_ring_ai.simulate import simulate
+
+
+def play_randomly(env, step):
+    decisions = 0
+    while not step.done:
+        rng = env.state.rng.agents
+        step = env.step(rng.randrange(len(step.request.options)))
+        decisions += 1
+    return step, decisions
+
+
+def test_env_matches_engine_driven_games():
+    env = GameEnv(seed=8)
+    for result in simulate(10, seed=8):
+        step, decisions = play_randomly(env, env.reset())
+        assert (step.winner, step.error, decisions) == (
+            result.winner,
+            result.error,
+            result.decisions,
+        )
+    env.close()
+
+
+def test_env_rejects_invalid_options():
+    env = GameEnv(seed=1)
+    with pytest.raises(RuntimeError):
+        env.step(0)
+    step = env.reset()
+    with pytest.raises(IndexError):
+        env.step(len(step.request.options))
+    env.reset()
+    env.close()
+    assert env.last.done
+
+
+def test_vector_env_steps_in_lockstep():
+    envs = VectorGameEnv(4, seed=3)
+    steps = envs.reset()
+    assert all(step.request is not None for step in steps)
+    finished = 0
+    for _ in range(100):
+        steps = envs.step([0] * len(steps))
+        assert all(step.request is not None for step in steps)
+        finished += sum(step.done for step in steps)
+    assert envs.next_game == 4 + finished
+    envs.close()
+
+
+def raise_key_error(_):
+    raise KeyError("engine bug")
+
+
+def test_env_raises_engine_errors(monkeypatch):
+    env = GameEnv(seed=2)
+    monkeypatch.setattr(GameManager, "play", raise_key_error)
+    with pytest.raises(KeyError):
+        env.reset()
+    with pytest.raises(RuntimeError):
+        env.step(0)
+    with pytest.raises(KeyError):
+        VectorGameEnv(2, seed=2).reset()
+
+    monkeypatch.undo()
+    assert not env.reset().done
+    env.close()
+
+
+def test_async_env_raises_engine_errors(monkeypatch):
+    async def reset():
+        env = AsyncGameEnv(seed=2)
+        with pytest.raises(KeyError):
+            await env.reset_async()
+
+    monkeypatch.setattr(GameManager, "play", raise_key_error)
+    asyncio.run(asyncio.wait_for(reset(), 5))
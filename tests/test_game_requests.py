@@ -0,0 +1,187 @@
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from war_of_the_ring_ai.game_manager import TurnManager
+from war_of_the_ring_ai.game_objects import (
+    Action,
+    Army,
+    CharacterID,
+    Nation,
+    Side,
+    UnitType,
+    army_unit,
+)
+from war_of_the_ring_ai.game_requests import (
+    ActionRequest,
+    ChangeGuide,
+    MoveArmyUnits,
+    PalantirAction,
+    actions_in,
+)
+from war_of_the_ring_ai.game_state import ALL_COMPANIONS, GameState
+
+
+def power_set_selections(army, leader_required):
+    # The original enumeration of every combination of units, deduplicated
+    return {
+        frozenset(Counter(combination).items())
+        for i in range(1, len(army.units))
+        for combination in combinations(army.units, i)
+        if not leader_required
+        or any(unit.type == UnitType.LEADER for unit in combination)
+    }
+
+
+def make_army(*stacks):
+    state = GameState()
+    army = Army(Side.FREE, state.regions.with_name("Fangorn"))
+    for unit_type, nation, count in stacks:
+        army.add(army_unit(unit_type, nation), count)
+    return army
+
+
+ARMIES = [
+    [(UnitType.REGULAR, Nation.GONDOR, 1)],
+    [(UnitType.REGULAR, Nation.GONDOR, 3), (UnitType.LEADER, Nation.GONDOR, 1)],
+    [
+        (UnitType.REGULAR, Nation.ROHAN, 4),
+        (UnitType.ELITE, Nation.ROHAN, 2),
+        (UnitType.LEADER, Nation.ROHAN, 1),
+        (UnitType.REGULAR, Nation.NORTH, 2),
+        (UnitType.LEADER, Nation.NORTH, 1),
+    ],
+]
+
+
+@pytest.mark.parametrize("stacks", ARMIES)
+@pytest.mark.parametrize("leader_required", [False, True])
+def test_unit_selections_match_power_set(stacks, leader_required):
+    army = make_army(*stacks)
+    options = MoveArmyUnits(army, leader_required).options
+    selections = [frozenset(Counter(option).items()) for option in options]
+    assert len(selections) == len(set(selections))
+    assert set(selections) == power_set_selections(army, leader_required)
+    for i, option in enumerate(options):
+        assert options.index(option) == i
+        assert option in options
+
+
+def test_unit_selections_are_counts():
+    army = make_army(
+        (UnitType.REGULAR, Nation.ROHAN, 10), (UnitType.LEADER, Nation.ROHAN, 2)
+    )
+    options = MoveArmyUnits(army, True).options
+    assert len(options) == 11 * 3 - 11 - 1
+    counts = options.counts(0)
+    assert [unit for unit, _ in options.stacks] == [
+        army_unit(UnitType.REGULAR, Nation.ROHAN),
+        army_unit(UnitType.LEADER, Nation.ROHAN),
+    ]
+    assert counts == [0, 1]
+    assert options[-1] == options.selection([9, 2])
+    assert army.units not in options
+    with pytest.raises(IndexError):
+        options.counts(len(options))
+
+
+@pytest.mark.parametrize("side", list(Side))
+def test_will_action_options_are_unique(side):
+    state = GameState()
+    turn = TurnManager(state)
+    turn.active_player = state.players[side.value]
+    will = turn.will_action()
+    options = will.options
+    assert len(options) == len(set(options))
+    assert options.count(Action.SKIP) == 1
+    assert set(will.hybrid_action_request.options) <= set(options)
+    assert set(will.character_action_request.options) <= set(options)
+
+
+def test_options_are_built_once_on_first_access(monkeypatch):
+    builds = Counter()
+    action_masks = {}
+
+    def counting(cls):
+        def action_mask(self):
+            builds[cls.__name__] += 1
+            return action_masks[cls](self)
+
+        return action_mask
+
+    for cls in ActionRequest.__subclasses__():
+        action_masks[cls] = cls.action_mask
+        monkeypatch.setattr(cls, "action_mask", counting(cls))
+
+    will = TurnManager(GameState()).will_action()
+    assert not builds
+    first = will.options
+    assert will.options is first
+    assert builds == {
+        "WillAction": 1,
+        "CharacterAction": 1,
+        "HybridAction": 1,
+        "ArmyAction": 1,
+        "MusterAction": 1,
+        "PalantirAction": 1,
+    }
+
+
+def test_memoized_muster_options_follow_state_changes():
+    state = GameState()
+    turn = TurnManager(state)
+    turn.active_player = state.shadow_player
+    assert turn.muster_action().options == [Action.SKIP, Action.DIPLOMACY]
+    state.set_disposition(Nation.ISENGARD, 0)
+    assert turn.muster_action().options == [
+        Action.SKIP,
+        Action.DIPLOMACY,
+        Action.MUSTER_ELITE,
+        Action.MUSTER_REGULAR_REGULAR,
+        Action.MUSTER_SARUMAN,
+    ]
+
+
+@pytest.mark.parametrize("side", list(Side))
+def test_action_masks_match_options(side):
+    state = GameState()
+    turn = TurnManager(state)
+    turn.active_player = state.players[side.value]
+    state.set_disposition(Nation.ISENGARD, 0)
+    state.draw_card(turn.active_player, turn.active_player.strategy_deck)
+    requests = [
+        turn.character_action(),
+        turn.army_action(),
+        turn.muster_action(),
+        PalantirAction(turn.active_player),
+        turn.hybrid_action(),
+        turn.will_action(),
+    ]
+    for request in requests:
+        mask = request.action_mask()
+        assert request.options == actions_in(mask)
+        assert request.options == sorted(request.options, key=lambda a: a.value)
+        assert mask == sum(1 << action.value for action in request.options)
+    # Will actions include every character, army, muster and palantir action
+    hybrid, will = requests[-2:]
+    for request in requests[:-1]:
+        assert will.action_mask() & request.action_mask() == request.action_mask()
+    assert hybrid.action_mask() == requests[1].action_mask() | requests[2].action_mask()
+
+
+def test_change_guide_offers_highest_level_survivors():
+    gandalf, strider, gimli, merry, gollum = (
+        ALL_COMPANIONS[name]
+        for name in (
+            CharacterID.GANDALF_GREY,
+            CharacterID.STRIDER,
+            CharacterID.GIMLI,
+            CharacterID.MERRY,
+            CharacterID.GOLLUM,
+        )
+    )
+    # The casualty is not always one of the highest level companions
+    assert ChangeGuide([gandalf, strider, merry], merry).options == [gandalf, strider]
+    assert ChangeGuide([gandalf, gimli, merry], gandalf).options == [gimli]
+    assert ChangeGuide([merry], merry).options == [gollum]
@@ -1,7 +1,21 @@
 import pytest
 
-from war_of_the_ring_ai.game_objects import Nation, UnitType
-from war_of_the_ring_ai.game_state import GameState
+from war_of_the_ring_ai.game_objects import (
+    ArmyUnit,
+    CharacterID,
+    Nation,
+    Side,
+    UnitType,
+    army_unit,
+)
+from war_of_the_ring_ai.game_random import GameRandom
+from war_of_the_ring_ai.game_state import (
+    ALL_COMPANIONS,
+    ALL_MINIONS,
+    Concern,
+    GameState,
+)
+from war_of_the_ring_ai.simulate import play_game
 
 
 def test_deck_sizes():
@@ -61,3 +75,369 @@ def test_region_search():
     }
     actual_region_names = {region.name for region in region.reachable_regions(distance)}
     assert expected_region_names == actual_region_names
+
+
+def test_region_distances():
+    state = GameState()
+    regions = state.regions
+    grey_havens = regions.with_name("Grey Havens")
+    assert regions.distance(grey_havens, grey_havens) == 0
+    assert regions.distance(grey_havens, regions.with_name("Forlindon")) == 1
+    assert regions.distance(grey_havens, regions.with_name("The Shire")) == 2
+    for origin in regions.regions_by_name.values():
+        for destination in regions.regions_by_name.values():
+            distance = regions.distance(origin, destination)
+            assert distance == regions.distance(destination, origin)
+            assert destination in origin.reachable_regions(distance)
+            if distance > 0:
+                assert destination not in origin.reachable_regions(distance - 1)
+
+
+def test_region_search_beyond_map():
+    state = GameState()
+    region = state.regions.with_name("Grey Havens")
+    reachable = region.reachable_regions(1000)
+    assert type(reachable) is set  # pylint: disable=unidiomatic-typecheck
+    assert reachable == set(state.regions.regions_by_name.values())
+
+
+def test_region_ids():
+    state = GameState()
+    regions = state.regions
+    assert [region.id for region in regions.regions] == list(range(105))
+    for region in regions.regions:
+        assert regions.regions_in(region.mask) == [region]
+        assert regions.regions_in(region.neighbor_mask) == sorted(
+            region.neighbors, key=lambda r: r.id
+        )
+
+
+@pytest.mark.parametrize("side", list(Side))
+def test_region_masks(side):
+    state = GameState()
+    regions = state.regions
+    regions.set_conquered(regions.with_name("Minas Tirith"), True)
+    regions.set_conquered(regions.with_name("Dol Guldur"), True)
+    for region in regions.regions:
+        assert bool(regions.controlled_mask(side) & region.mask) == (
+            region.nation is not None and not region.is_enemy_controlled(side)
+        )
+        assert bool(regions.army_mask(side) & region.mask) == (
+            region.has_friendly_army(side)
+        )
+        assert bool(regions.free_mask(side) & region.mask) == region.is_free(side)
+        assert bool(regions.free_for_movement_mask(side) & region.mask) == (
+            region.is_free_for_movement(side)
+        )
+
+
+def test_region_indexes_follow_mutations():
+    state = GameState()
+    regions = state.regions
+    rivendell = regions.with_name("Rivendell")
+    orthanc = regions.with_name("Orthanc")
+    elite = ArmyUnit(UnitType.ELITE, Nation.ELVES)
+    saruman = ALL_MINIONS[CharacterID.SARUMAN]
+
+    regions.add_units(rivendell, Side.FREE, [elite])
+    regions.add_character(orthanc, Side.SHADOW, saruman)
+    regions.remove_units(orthanc, list(orthanc.army.units))
+    assert regions.with_character(CharacterID.SARUMAN) == orthanc
+    assert orthanc in regions.with_characters(Side.SHADOW)
+
+    for side in Side:
+        assert regions.with_army_units(side) == regions.with_predicate(
+            lambda r, s=side: r.has_friendly_army(s)
+        )
+    assert orthanc not in regions.with_army_units(Side.SHADOW)
+
+    regions.remove_character(orthanc, saruman)
+    assert not regions.with_characters()
+    with pytest.raises(KeyError):
+        regions.with_character(CharacterID.SARUMAN)
+
+
+def assert_frontier(regions):
+    for side in Side:
+        for region in regions.regions:
+            army = region.army if region.has_friendly_army(side) else None
+            assert bool(regions.move_mask(side) & region.mask) == bool(
+                army and army.valid_moves()
+            )
+            assert bool(regions.attack_mask(side) & region.mask) == bool(
+                army and army.valid_attacks()
+            )
+
+
+def test_frontier_follows_mutations():
+    state = GameState()
+    regions = state.regions
+    assert_frontier(regions)
+    assert regions.move_mask(Side.FREE) and regions.move_mask(Side.SHADOW)
+    attacks = regions.attack_mask(Side.FREE)
+
+    # A shadow army in Parth Celebrant can be attacked by the elves in Lorien
+    parth_celebrant = regions.with_name("Parth Celebrant")
+    lorien = regions.with_name("Lorien")
+    units = [army_unit(UnitType.REGULAR, Nation.ISENGARD)] * 2
+    state.checkpoint()
+    state.add_units(parth_celebrant, Side.SHADOW, units)
+    assert not attacks & lorien.mask
+    assert regions.attack_mask(Side.FREE) & lorien.mask
+    assert regions.attack_mask(Side.SHADOW) & parth_celebrant.mask
+    assert_frontier(regions)
+
+    clone = state.clone()
+    clone.set_conquered(clone.regions.with_name("Edoras"), True)
+    clone.remove_units(clone.regions.with_name("Lorien"), list(lorien.army.units))
+    assert_frontier(clone.regions)
+
+    state.undo()
+    assert regions.attack_mask(Side.FREE) == attacks
+    assert_frontier(regions)
+    state.reset()
+    assert_frontier(regions)
+
+
+def test_character_locations():
+    state = GameState()
+    minas_tirith = state.regions.with_name("Minas Tirith")
+    strider = ALL_COMPANIONS[CharacterID.STRIDER]
+    assert not state.has_character(CharacterID.STRIDER)
+
+    state.add_character(minas_tirith, Side.FREE, strider)
+    assert state.character_location(CharacterID.STRIDER) == minas_tirith
+    assert minas_tirith.army.has_character(CharacterID.STRIDER)
+
+    assert state.remove_character(strider) == minas_tirith
+    assert not state.has_character(CharacterID.STRIDER)
+    assert not minas_tirith.army.has_character(CharacterID.STRIDER)
+
+
+def test_army_unit_counts():
+    state = GameState()
+    army = state.regions.with_name("Minas Tirith").army
+    regular = ArmyUnit(UnitType.REGULAR, Nation.GONDOR)
+    leader = ArmyUnit(UnitType.LEADER, Nation.ROHAN)
+    regulars, leaders, size = army.regulars(), army.leaders(), army.size()
+
+    army.add(regular, 2)
+    army.add(leader)
+    assert army.regulars() == regulars + 2
+    assert army.leaders() == leaders + 1
+    assert army.size() == size + 2
+    assert army.count(leader) == 1
+    assert army.has_nation(Nation.ROHAN)
+    assert army.units.count(regular) == army.count(regular)
+
+    army.remove(leader)
+    assert not army.has_nation(Nation.ROHAN)
+    with pytest.raises(ValueError):
+        army.remove(leader)
+
+
+def test_game_objects_are_compact():
+    state = GameState()
+    region = state.regions.with_name("Lorien")
+    objects = [
+        region,
+        region.army,
+        state.fellowship,
+        state.fellowship.guide,
+        state.free_player,
+        state.free_player.character_deck[0],
+        state.hunt_pool.tiles[0],
+    ]
+    for obj in objects:
+        assert not hasattr(obj, "__dict__")
+    assert all(unit is army_unit(unit.type, unit.nation) for unit in region.army.units)
+
+
+def test_clone_is_independent():
+    state = GameState()
+    clone = state.clone()
+    assert [repr(region) for region in clone.regions.regions] == [
+        repr(region) for region in state.regions.regions
+    ]
+    assert clone.fellowship.location is clone.regions.with_name("Rivendell")
+    assert clone.regions.distances is state.regions.distances
+
+    lorien = clone.regions.with_name("Lorien")
+    clone.regions.remove_units(lorien, lorien.army.units)
+    clone.free_player.hand.append(clone.free_player.character_deck.pop())
+    clone.politics[Nation.ELVES].disposition -= 1
+    clone.reinforcements[Nation.ELVES][0] -= 1
+    clone.hunt_pool.draw()
+
+    assert state.regions.with_name("Lorien").army.has_units()
+    assert lorien not in clone.regions.with_army_units(Side.FREE)
+    assert not state.free_player.hand
+    assert len(state.free_player.character_deck) == 24
+    assert state.politics[Nation.ELVES].disposition == 3
+    assert state.reinforcements[Nation.ELVES][0] == 2
+    assert len(state.hunt_pool.tiles) == 16
+    for region in clone.regions.regions:
+        assert all(
+            neighbor is clone.regions.regions[neighbor.id]
+            for neighbor in region.neighbors
+        )
+        if region.army is not None:
+            assert region.army.region is region
+
+
+def test_clone_regions_compare_by_identity():
+    state = GameState()
+    clone = state.clone()
+    original = state.regions.with_name("Lorien")
+    cloned = clone.regions.with_name("Lorien")
+    assert cloned != original
+    assert cloned not in {original}
+    assert cloned is clone.regions.with_name("Lorien")
+
+
+def test_clone_rollout_leaves_original_agents_untouched():
+    state = GameState(rng=GameRandom(3))
+    agents = state.rng.agents.getstate()
+    clone = state.clone()
+    play_game(clone)
+    assert sum(player.agent.decisions for player in clone.players) > 0
+    assert all(player.agent.decisions == 0 for player in state.players)
+    assert state.rng.agents.getstate() == agents
+    assert clone.rng.agents.getstate() != agents
+    assert all(player.agent.rng is state.rng.agents for player in state.players)
+
+
+def test_undo_restores_state():
+    state = GameState()
+    player = state.free_player
+    lorien = state.regions.with_name("Lorien")
+    fangorn = state.regions.with_name("Fangorn")
+    units = lorien.army.units
+    hand = list(player.hand)
+    deck = list(player.character_deck)
+    tiles = list(state.hunt_pool.tiles)
+    armies = dict(state.regions.army_masks)
+    guide = state.fellowship.guide
+
+    state.checkpoint()
+    state.remove_units(lorien, units)
+    state.add_units(fangorn, Side.FREE, units)
+    state.checkpoint()
+    card = state.draw_card(player, player.character_deck)
+    state.set_disposition(Nation.DWARVES, 2)
+    state.reserve_hunt_tile(state.draw_hunt_tile())
+    state.set_corruption(5)
+    state.remove_companion(guide)
+    state.add_mustered(ALL_MINIONS[CharacterID.SARUMAN])
+    state.add_character(lorien, Side.SHADOW, ALL_MINIONS[CharacterID.SARUMAN])
+
+    state.undo()
+    assert card not in player.hand
+    assert list(player.character_deck) == deck
+    assert state.politics[Nation.DWARVES].disposition == 3
+    assert list(state.hunt_pool.tiles) == tiles
+    assert not state.hunt_pool.reserve
+    assert state.fellowship.corruption == 0
+    assert guide in state.fellowship.companions
+    assert not state.characters_mustered
+    assert not state.has_character(CharacterID.SARUMAN)
+    assert fangorn.army.count(units[0]) > 0
+
+    state.undo()
+    assert lorien.army.units == units
+    assert fangorn.army is None
+    assert state.regions.army_masks == armies
+    assert player.hand == hand
+    assert not state.undo_log
+
+
+def test_legality_checks_are_memoized_until_their_concerns_change():
+    state = GameState()
+    checks = []
+
+    def check():
+        checks.append(len(checks))
+        return checks[-1]
+
+    def memoized(state):
+        return state.legality.memoize(
+            "check", (Concern.POLITICS, Concern.ARMIES), check
+        )
+
+    assert memoized(state) == 0
+    assert memoized(state) == 0
+    state.set_reinforcements(Nation.GONDOR, UnitType.REGULAR, 0)
+    assert memoized(state) == 0
+
+    state.checkpoint()
+    state.set_disposition(Nation.DWARVES, 2)
+    assert memoized(state) == 1
+    state.undo()
+    assert memoized(state) == 2
+
+    clone = state.clone()
+    clone.set_conquered(clone.regions.with_name("Erebor"), True)
+    assert memoized(clone) == 3
+    assert memoized(state) == 2
+
+    state.reset()
+    assert memoized(state) == 4
+
+
+def test_game_creation_does_not_read_data_files(monkeypatch, tmp_path):
+    GameState()
+    monkeypatch.chdir(tmp_path)
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("Data files should only be read once per process.")
+
+    monkeypatch.setattr("builtins.open", fail_open)
+    state = GameState()
+    assert len(state.free_player.character_deck) == 24
+    assert state.regions.with_name("Lorien").army.has_units()
+
+
+def test_reset_restores_starting_setup():
+    state = GameState()
+    regions = list(state.regions.regions)
+    player = state.free_player
+    lorien = state.regions.with_name("Lorien")
+    units = lorien.army.units
+    state.remove_units(lorien, units)
+    state.add_units(state.regions.with_name("Fangorn"), Side.FREE, units)
+    state.add_character(lorien, Side.SHADOW, ALL_MINIONS[CharacterID.SARUMAN])
+    state.set_conquered(lorien, True)
+    state.draw_card(player, player.character_deck)
+    state.set_disposition(Nation.DWARVES, 0)
+    state.set_reinforcements(Nation.ELVES, UnitType.ELITE, 0)
+    state.reserve_hunt_tile(state.draw_hunt_tile())
+    state.enter_mordor()
+    state.set_corruption(5)
+    state.remove_companion(state.fellowship.guide)
+    state.checkpoint()
+    lorien_army = lorien.army
+
+    state.reset(seed=7, game=2)
+    fresh = GameState(rng=GameRandom(7, 2))
+    assert state.regions.regions == regions
+    assert lorien.army is lorien_army
+    assert [repr(region) for region in state.regions.regions] == [
+        repr(region) for region in fresh.regions.regions
+    ]
+    assert state.regions.army_masks == fresh.regions.army_masks
+    assert state.regions.conquered_mask == fresh.regions.conquered_mask
+    assert state.character_locations == {
+        character: state.regions.with_name(region.name)
+        for character, region in fresh.character_locations.items()
+    }
+    assert state.fellowship.location is state.regions.with_name("Rivendell")
+    assert state.fellowship.companions == fresh.fellowship.companions
+    assert state.politics == fresh.politics
+    assert state.reinforcements == fresh.reinforcements
+    for player, fresh_player in zip(state.players, fresh.players):
+        assert player.character_deck == fresh_player.character_deck
+        assert player.strategy_deck == fresh_player.strategy_deck
+        assert not player.hand
+    assert state.hunt_pool == fresh.hunt_pool
+    assert state.zobrist == fresh.zobrist
+    assert not state.undo_marks
@@ -0,0 +1,64 @@
+import itertools
+import random
+
+import pytest
+
+from war_of_the_ring_ai.match import (
+    SPRT,
+    main,
+    match_outcomes,
+    play_match,
+    run_sprt,
+)
+
+
+def test_sprt_accepts_clear_winner():
+    result = run_sprt(SPRT(margin=0.1), itertools.repeat(True), 1000)
+    assert result.accepted is True
+    assert result.games < 20
+    assert result.games_saved == 1000 - result.games
+
+
+def test_sprt_rejects_even_match():
+    rng = random.Random(0)
+    outcomes = (rng.random() < 0.5 for _ in itertools.count())
+    result = run_sprt(SPRT(margin=0.1), outcomes, 10000)
+    assert result.accepted is False
+    assert result.games_saved > 0
+
+
+def test_sprt_ignores_unfinished_games():
+    result = run_sprt(SPRT(), itertools.repeat(None), 50)
+    assert result.accepted is None
+    assert result.unfinished == 50
+    assert result.games_saved == 0
+
+
+@pytest.mark.parametrize(
+    "test",
+    [
+        {"margin": 0},
+        {"margin": -0.1},
+        {"margin": 0.5},
+        {"p0": 0},
+        {"p0": 0.9, "margin": 0.2},
+        {"alpha": 0},
+        {"beta": 1},
+    ],
+)
+def test_sprt_rejects_invalid_parameters(test):
+    with pytest.raises(ValueError):
+        SPRT(**test)
+
+
+def test_match_reports_invalid_margin(capsys):
+    with pytest.raises(SystemExit):
+        main(["--margin", "0.6"])
+    assert "p0 + margin < 1" in capsys.readouterr().err
+
+
+def test_match_alternates_sides_on_shared_seeds():
+    outcomes = list(itertools.islice(match_outcomes("random", "random", 3), 10))
+    assert len(outcomes) == 10
+    result = play_match("random", "random", SPRT(), 10, seed=3)
+    assert result.games == 10
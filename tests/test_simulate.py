@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from war_of_the_ring_ai.game_manager import GameManager
+from war_of_the_ring_ai.game_state import INITIAL_HUNT_TILES, GameState
+from war_of_the_ring_ai.simulate import (
+    main,
+    new_game,
+    play_game,
+    replay,
+    simulate,
+    simulate_threaded,
+    summarize,
+)
+
+
+def outcomes(results):
+    return [
+        (result.winner, result.turns, result.decisions, result.error)
+        for result in results
+    ]
+
+
+def test_simulation_is_reproducible():
+    first = outcomes(simulate(20, seed=3))
+    assert first == outcomes(simulate(20, seed=3))
+    assert all(decisions > 0 for _, _, decisions, _ in first)
+
+
+def test_games_replay_from_seed_and_index():
+    results = list(simulate(10, seed=5))
+    assert len({(result.seed, result.game) for result in results}) == 10
+    for result in results[3:6]:
+        assert outcomes([replay(result.seed, result.game)]) == outcomes([result])
+
+
+def test_concurrent_games_match_sequential_games():
+    sequential = outcomes(simulate(40, seed=11))
+    assert outcomes(simulate_threaded(40, seed=11, threads=8)) == sequential
+
+
+def test_games_do_not_share_setup_data():
+    list(simulate(20, seed=1))
+    assert len(INITIAL_HUNT_TILES) == 16
+    assert len(GameState().hunt_pool.tiles) == 16
+
+
+def test_simulation_output(tmp_path, capsys):
+    output = tmp_path / "results.jsonl"
+    main(["--games", "5", "--seed", "0", "--output", str(output)])
+    report = capsys.readouterr().out
+    assert "Games/s" in report
+    assert "Decisions/s" in report
+    results = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [result["game"] for result in results] == list(range(5))
+
+
+def test_engine_errors_are_not_reported_as_unfinished_games(monkeypatch):
+    def fail(_):
+        raise ValueError("engine bug")
+
+    monkeypatch.setattr(GameManager, "play", fail)
+    with pytest.raises(ValueError):
+        play_game(new_game("random", "random", 0))
+
+
+def test_summary_warns_about_unfinished_games():
+    summary = summarize(simulate(5, seed=0), 1.0)
+    assert summary.unfinished == 5
+    assert "5 of 5 games" in summary.report()
@@ -0,0 +1,56 @@
+import pytest
+
+from war_of_the_ring_ai.game_objects import Side
+from war_of_the_ring_ai.simulate import simulate
+from war_of_the_ring_ai.tournament import (
+    Pairing,
+    Standings,
+    batch_size,
+    play_tournament,
+    run,
+    wilson_interval,
+)
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(50, 100)
+    assert low == pytest.approx(0.4038, abs=1e-4)
+    assert high == pytest.approx(0.5962, abs=1e-4)
+    assert wilson_interval(0, 10)[0] == 0.0
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_standings():
+    standings = Standings(Pairing("random", "random"))
+    for result in simulate(30, seed=2):
+        standings.add(result)
+    assert standings.games == 30
+    assert sum(standings.wins.values()) + standings.unfinished == 30
+    for side in Side:
+        low, high = standings.confidence_interval(side)
+        assert low <= standings.win_rate(side) <= high
+
+
+def test_parse_pairing():
+    assert Pairing.parse("random:human") == Pairing("random", "human")
+    assert Pairing.parse("random") == Pairing("random", "random")
+
+
+def test_batch_size_spreads_games_across_workers():
+    assert batch_size(100, 1) == 25
+    assert batch_size(100, 8) == 4
+    assert batch_size(100, 64) == 1
+    assert batch_size(1_000_000, 8) == 64
+    assert batch_size(0, 8) == 1
+
+
+def test_tournament_matches_sequential_games():
+    pairings = [Pairing.parse("random")]
+    results = {pairing: [] for pairing in pairings}
+    for pairing, result in play_tournament(pairings, 100, seed=4, workers=2):
+        results[pairing].append(result)
+    expected = [(r.winner, r.turns, r.decisions) for r in simulate(100, seed=4)]
+    for pairing in pairings:
+        played = sorted(results[pairing], key=lambda result: result.game)
+        assert [(r.winner, r.turns, r.decisions) for r in played] == expected
+    assert run(pairings, 10, seed=4, workers=2)[pairings[0]].games == 10
@@ -0,0 +1,107 @@
+from collections import Counter
+from itertools import product
+
+from war_of_the_ring_ai.game_objects import (
+    CharacterID,
+    DieResult,
+    Nation,
+    Side,
+    UnitType,
+    army_unit,
+)
+from war_of_the_ring_ai.game_state import ALL_MINIONS, GameState
+from war_of_the_ring_ai.transposition import TranspositionTable
+from war_of_the_ring_ai.zobrist import HashFeature, zobrist_key
+
+
+def test_incremental_hash_matches_full_hash():
+    state = GameState()
+    initial_hash = state.zobrist
+    lorien = state.regions.with_name("Lorien")
+    fangorn = state.regions.with_name("Fangorn")
+    elite = army_unit(UnitType.ELITE, Nation.ELVES)
+
+    state.checkpoint()
+    state.remove_units(lorien, [elite])
+    state.add_units(fangorn, Side.FREE, [elite])
+    state.add_character(fangorn, Side.FREE, ALL_MINIONS[CharacterID.SARUMAN])
+    state.set_conquered(lorien, True)
+    state.set_disposition(Nation.ROHAN, 1)
+    state.set_dice(state.free_player, Counter([DieResult.WILL, DieResult.WILL]))
+    state.set_die_count(state.free_player, DieResult.WILL, 1)
+    state.set_hunt_box_eyes(2)
+    state.set_fellowship_location(fangorn)
+    state.set_fellowship_progress(3)
+    state.set_corruption(4)
+    state.set_revealed(True)
+    assert state.zobrist != initial_hash
+    assert state.zobrist == state.compute_zobrist()
+
+    state.undo()
+    assert state.zobrist == initial_hash
+    assert state.zobrist == state.compute_zobrist()
+
+
+def test_transpositions_hash_equal():
+    first = GameState()
+    second = first.clone()
+    elite = army_unit(UnitType.ELITE, Nation.ELVES)
+
+    first.remove_units(first.regions.with_name("Lorien"), [elite])
+    first.set_hunt_box_eyes(1)
+    second.set_hunt_box_eyes(1)
+    second.remove_units(second.regions.with_name("Lorien"), [elite])
+    assert first.zobrist == second.zobrist
+
+    second.add_units(second.regions.with_name("Fangorn"), Side.FREE, [elite])
+    assert first.zobrist != second.zobrist
+
+
+def test_keys_are_distinct_across_features_and_index_counts():
+    values = (-1, 0, 1, 2, 3, 9)
+    inputs = [
+        (feature, *indexes)
+        for feature in HashFeature
+        for count in range(4)
+        for indexes in product(values, repeat=count)
+    ]
+    keys = {zobrist_key(*key) for key in inputs}
+    assert len(keys) == len(inputs)
+    assert zobrist_key(HashFeature.HUNT_BOX_EYES, 3) != zobrist_key(
+        HashFeature.UNITS, 0, 9, 3
+    )
+
+
+def test_different_positions_hash_differently():
+    first = GameState()
+    second = first.clone()
+    region = first.regions.regions[0]
+    elite = army_unit(UnitType.ELITE, Nation.DWARVES)
+    first.set_fellowship_progress(2)
+    first.add_units(region, Side.FREE, [elite])
+    second.set_fellowship_progress(1)
+    second.add_units(second.regions.regions[0], Side.FREE, [elite, elite])
+    assert first.zobrist != second.zobrist
+
+
+def test_transposition_table_evicts_least_recently_used():
+    table: TranspositionTable[str] = TranspositionTable(2)
+    table.store(1, "a")
+    table.store(2, "b")
+    assert table.lookup(1) == "a"
+    table.store(3, "c")
+    assert 1 in table
+    assert 2 not in table
+    assert len(table) == 2
+
+
+def test_transposition_table_prefers_deeper_results():
+    table: TranspositionTable[str] = TranspositionTable(4)
+    table.store(1, "deep", depth=3)
+    table.store(1, "shallow", depth=1)
+    assert table.lookup(1) == "deep"
+    assert table.lookup(1, depth=4) is None
+    table.store(1, "deeper", depth=4)
+    assert table.lookup(1, depth=4) == "deeper"
+    assert table.hits == 2
+    assert table.misses == 1
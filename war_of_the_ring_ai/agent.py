@@ -1,17 +1,31 @@
+import asyncio
 import random
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+
+from war_of_the_ring_ai.decision_log import DecisionLog
 
 if TYPE_CHECKING:
     from war_of_the_ring_ai.game_requests import Request
 
-Strategy = Callable[["Request"], Any]
+Strategy = Callable[["Request", random.Random], Any]
+
+
+class NoValidOptions(ValueError):
+    # A decision was requested where the rules implemented so far allow no choice
+    pass
+
 
+# Async strategies return the index of the chosen option, as a remote agent would
+AsyncStrategy = Callable[["Request", random.Random], Awaitable[int]]
 
-def random_strategy(request: "Request") -> Any:
-    return random.choice(request.options)
 
+def random_strategy(request: "Request", rng: random.Random) -> Any:
+    return rng.choice(request.options)
 
-def human_strategy(request: "Request") -> Any:
+
+def human_strategy(  # pylint: disable=unused-argument
+    request: "Request", rng: random.Random
+) -> Any:
     print(f"{type(request).__name__}")
     for i, choice in enumerate(request.options):
         print(f"{i}: {choice}")
@@ -19,17 +33,62 @@ def human_strategy(request: "Request") -> Any:
     return request.options[selection]
 
 
+STRATEGIES: dict[str, Strategy] = {
+    "random": random_strategy,
+    "human": human_strategy,
+}
+
+
 class Agent:  # pylint: disable=too-few-public-methods
-    def __init__(self, name: str, strategy: Strategy) -> None:
+    def __init__(
+        self,
+        name: str,
+        strategy: Strategy,
+        log: Optional[DecisionLog] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
         self.name: str = name
         self.strategy: Strategy = strategy
+        self.decisions: int = 0
+        self.log: Optional[DecisionLog] = log
+        # Agents in a game draw from the agent stream of that game's GameRandom
+        self.rng: random.Random = random.Random() if rng is None else rng
 
     def response(self, request: "Request") -> Any:
-        request_name = type(request).__name__
         if len(request.options) == 0:
-            raise ValueError(
-                f"Request {request_name} yielded no valid response options."
+            raise NoValidOptions(
+                f"Request {type(request).__name__} yielded no valid response options."
+            )
+        self.decisions += 1
+        response = self.strategy(request, self.rng)
+        if self.log is not None:
+            self.log.record(
+                type(request), request.options.index(response), len(request.options)
             )
-        response = self.strategy(request)
-        print(f"<{self.name}> {request_name}: {response}")
         return response
+
+
+def delayed_random_strategy(latency: float) -> AsyncStrategy:
+    # Stands in for an agent in a subprocess or behind a socket
+    async def strategy(request: "Request", rng: random.Random) -> int:
+        await asyncio.sleep(latency)
+        return rng.randrange(len(request.options))
+
+    return strategy
+
+
+class AsyncAgent:  # pylint: disable=too-few-public-methods
+    def __init__(
+        self,
+        name: str,
+        strategy: AsyncStrategy,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.name: str = name
+        self.strategy: AsyncStrategy = strategy
+        self.decisions: int = 0
+        self.rng: random.Random = random.Random() if rng is None else rng
+
+    async def choose(self, request: "Request") -> int:
+        self.decisions += 1
+        return await self.strategy(request, self.rng)
@@ -0,0 +1,342 @@
+"""Compiled game assets.
+
+The world map, card list and politics track are maintained as pipe-delimited CSV files
+in the package's data directory. They are compiled into a single binary asset holding
+integer region IDs, the adjacency table, precomputed distances and the nation,
+settlement and starting army arrays. The asset is built by an explicit step into the
+user's cache directory, outside the source tree. Its header holds a checksum of the CSV
+sources and a digest of its own payload. At startup both are checked, and if the asset
+is missing, out of date or corrupt, the sources are compiled in memory instead. Nothing
+is written.
+
+Run ``python -m war_of_the_ring_ai.assets`` to build the asset.
+"""
+import csv
+import hashlib
+import io
+import os
+import struct
+from dataclasses import dataclass
+from functools import cache
+from importlib import resources
+from importlib.abc import Traversable
+from pathlib import Path
+from typing import Optional
+
+from war_of_the_ring_ai.game_objects import (
+    Card,
+    CardCategory,
+    Nation,
+    Settlement,
+    Side,
+)
+
+# The sources ship inside the package, so they are found from any install
+DATA_DIR = resources.files("war_of_the_ring_ai") / "data"
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "war-of-the-ring-ai"
+)
+ASSET_PATH = CACHE_DIR / "assets.bin"
+SOURCE_FILES = ("worldmap.csv", "cards.csv", "politics.csv")
+
+MAGIC = b"WOTR"
+VERSION = 2
+# Magic, version, checksum of the sources and digest of the payload that follows
+HEADER = struct.Struct("<4sH32s32s")
+COUNT = struct.Struct("<H")
+TEXT_SIZE = struct.Struct("<I")
+
+# Marks a missing nation or settlement, and a pair of regions with no path between them
+NONE = 255
+UNREACHABLE = 255
+
+
+@dataclass(frozen=True, slots=True)
+class RegionData:
+    name: str
+    neighbors: tuple[int, ...]
+    nation: Optional[Nation]
+    settlement: Optional[Settlement]
+    regulars: int
+    elites: int
+    leaders: int
+
+
+@dataclass(frozen=True, slots=True)
+class GameAssets:
+    regions: tuple[RegionData, ...]
+    distances: tuple[bytes, ...]
+    cards: tuple[Card, ...]
+    politics: tuple[tuple[Nation, int, bool], ...]
+
+
+def source_checksum(data_dir: Traversable = DATA_DIR) -> bytes:
+    checksum = hashlib.sha256(MAGIC + VERSION.to_bytes(2, "little"))
+    for name in SOURCE_FILES:
+        checksum.update(name.encode("utf8"))
+        checksum.update((data_dir / name).read_bytes())
+    return checksum.digest()
+
+
+def read_rows(data_dir: Traversable, name: str) -> list[list[str]]:
+    text = (data_dir / name).read_text(encoding="utf8")
+    return list(csv.reader(io.StringIO(text, newline=""), delimiter="|"))
+
+
+def parse_regions(data_dir: Traversable = DATA_DIR) -> list[RegionData]:
+    rows = read_rows(data_dir, "worldmap.csv")
+    ids = {row[0]: region_id for region_id, row in enumerate(rows)}
+    if len(ids) != len(rows):
+        raise ValueError("World map contains duplicate region names.")
+    regions = []
+    for (
+        name,
+        neighbor_str,
+        nation_str,
+        settlement_str,
+        regulars_str,
+        elites_str,
+        leaders_str,
+    ) in rows:
+        neighbors = neighbor_str.split(",")
+        for neighbor in neighbors:
+            if neighbor not in ids:
+                raise ValueError(f"{name} has unknown neighbor {neighbor}.")
+        regions.append(
+            RegionData(
+                name,
+                tuple(ids[neighbor] for neighbor in neighbors),
+                None if nation_str == "None" else Nation[nation_str.upper()],
+                None
+                if settlement_str == "None"
+                else Settlement[settlement_str.upper()],
+                int(regulars_str),
+                int(elites_str),
+                int(leaders_str),
+            )
+        )
+    return regions
+
+
+def parse_cards(data_dir: Traversable = DATA_DIR) -> list[Card]:
+    return [
+        Card(event, combat, Side[side], CardCategory[category])
+        for event, combat, side, category in read_rows(data_dir, "cards.csv")
+    ]
+
+
+def parse_politics(data_dir: Traversable = DATA_DIR) -> list[tuple[Nation, int, bool]]:
+    return [
+        (Nation[nation], int(disposition), active == "active")
+        for nation, disposition, active in read_rows(data_dir, "politics.csv")
+    ]
+
+
+def compute_distances(regions: list[RegionData]) -> list[bytes]:
+    distances = []
+    for origin in range(len(regions)):
+        row = bytearray([UNREACHABLE]) * len(regions)
+        row[origin] = 0
+        frontier = [origin]
+        while frontier:
+            next_frontier = []
+            for region in frontier:
+                for neighbor in regions[region].neighbors:
+                    if row[neighbor] == UNREACHABLE:
+                        row[neighbor] = row[region] + 1
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        distances.append(bytes(row))
+    return distances
+
+
+def validate_regions(regions: list[RegionData], distances: list[bytes]) -> None:
+    if len(regions) >= NONE:
+        raise ValueError(f"World map has too many regions ({len(regions)}).")
+    for region_id, region in enumerate(regions):
+        if region_id in region.neighbors:
+            raise ValueError(f"{region.name} is listed as its own neighbor.")
+        for neighbor in region.neighbors:
+            if region_id not in regions[neighbor].neighbors:
+                raise ValueError(
+                    f"{region.name} borders {regions[neighbor].name}, but not "
+                    "the other way around."
+                )
+        if UNREACHABLE in distances[region_id]:
+            raise ValueError(f"Some regions cannot be reached from {region.name}.")
+
+
+def compile_sources(data_dir: Traversable = DATA_DIR) -> GameAssets:
+    regions = parse_regions(data_dir)
+    distances = compute_distances(regions)
+    validate_regions(regions, distances)
+    return GameAssets(
+        tuple(regions),
+        tuple(distances),
+        tuple(parse_cards(data_dir)),
+        tuple(parse_politics(data_dir)),
+    )
+
+
+def encode_assets(assets: GameAssets, checksum: bytes) -> bytes:
+    text = "\0".join(
+        [region.name for region in assets.regions]
+        + [card.event_name for card in assets.cards]
+        + [card.combat_name for card in assets.cards]
+    ).encode("utf8")
+
+    neighbor_offsets = [0]
+    for region in assets.regions:
+        neighbor_offsets.append(neighbor_offsets[-1] + len(region.neighbors))
+
+    def optional_value(value: Optional[Nation | Settlement]) -> int:
+        return NONE if value is None else value.value
+
+    payload = b"".join(
+        [
+            TEXT_SIZE.pack(len(text)),
+            text,
+            COUNT.pack(len(assets.regions)),
+            bytes(optional_value(region.nation) for region in assets.regions),
+            bytes(optional_value(region.settlement) for region in assets.regions),
+            bytes(region.regulars for region in assets.regions),
+            bytes(region.elites for region in assets.regions),
+            bytes(region.leaders for region in assets.regions),
+            struct.pack(f"<{len(neighbor_offsets)}H", *neighbor_offsets),
+            bytes(
+                neighbor for region in assets.regions for neighbor in region.neighbors
+            ),
+            *assets.distances,
+            COUNT.pack(len(assets.cards)),
+            bytes(card.side.value for card in assets.cards),
+            bytes(card.category.value for card in assets.cards),
+            COUNT.pack(len(assets.politics)),
+            bytes(
+                value
+                for nation, disposition, active in assets.politics
+                for value in (nation.value, disposition, active)
+            ),
+        ]
+    )
+    digest = hashlib.sha256(payload).digest()
+    return HEADER.pack(MAGIC, VERSION, checksum, digest) + payload
+
+
+class _Reader:  # pylint: disable=too-few-public-methods
+    def __init__(self, buffer: bytes) -> None:
+        self.buffer = buffer
+        self.offset = 0
+
+    def read(self, size: int) -> bytes:
+        start = self.offset
+        self.offset += size
+        end = self.offset
+        return self.buffer[start:end]
+
+    def unpack(self, layout: struct.Struct) -> tuple[int, ...]:
+        values = layout.unpack_from(self.buffer, self.offset)
+        self.offset += layout.size
+        return values
+
+
+def decode_assets(buffer: bytes) -> GameAssets:
+    reader = _Reader(buffer)
+    reader.offset = HEADER.size
+    (text_size,) = reader.unpack(TEXT_SIZE)
+    text = reader.read(text_size).decode("utf8").split("\0")
+
+    (region_count,) = reader.unpack(COUNT)
+    nations, settlements, regulars, elites, leaders = (
+        reader.read(region_count) for _ in range(5)
+    )
+    offsets = reader.unpack(struct.Struct(f"<{region_count + 1}H"))
+    neighbors = reader.read(offsets[-1])
+    distances = tuple(reader.read(region_count) for _ in range(region_count))
+    regions = []
+    for i in range(region_count):
+        start, end = offsets[i], offsets[i + 1]
+        regions.append(
+            RegionData(
+                text[i],
+                tuple(neighbors[start:end]),
+                None if nations[i] == NONE else Nation(nations[i]),
+                None if settlements[i] == NONE else Settlement(settlements[i]),
+                regulars[i],
+                elites[i],
+                leaders[i],
+            )
+        )
+
+    (card_count,) = reader.unpack(COUNT)
+    sides, categories = reader.read(card_count), reader.read(card_count)
+    first_combat = region_count + card_count
+    events, combats = text[region_count:first_combat], text[first_combat:]
+    cards = tuple(
+        Card(events[i], combats[i], Side(sides[i]), CardCategory(categories[i]))
+        for i in range(card_count)
+    )
+
+    (politics_count,) = reader.unpack(COUNT)
+    politics_data = reader.read(3 * politics_count)
+    politics = tuple(
+        (Nation(politics_data[i]), politics_data[i + 1], bool(politics_data[i + 2]))
+        for i in range(0, len(politics_data), 3)
+    )
+    if reader.offset != len(buffer):
+        raise ValueError("Compiled asset does not match its own layout.")
+    return GameAssets(tuple(regions), distances, cards, politics)
+
+
+def compile_assets(
+    data_dir: Traversable = DATA_DIR, asset_path: Path = ASSET_PATH
+) -> GameAssets:
+    assets = compile_sources(data_dir)
+    encoded = encode_assets(assets, source_checksum(data_dir))
+    asset_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = asset_path.with_name(f"{asset_path.name}.{os.getpid()}.tmp")
+    temporary_path.write_bytes(encoded)
+    os.replace(temporary_path, asset_path)
+    return assets
+
+
+def read_assets(
+    data_dir: Traversable = DATA_DIR, asset_path: Path = ASSET_PATH
+) -> Optional[GameAssets]:
+    # Returns None if the compiled asset is missing, out of date with its sources, or
+    # corrupt. The payload digest catches corruption, and decoding errors are caught
+    # as well in case a damaged asset still matches it: struct.error, IndexError, or a
+    # ValueError, which includes UnicodeDecodeError and invalid enum values.
+    try:
+        buffer = asset_path.read_bytes()
+        if len(buffer) < HEADER.size:
+            return None
+        magic, version, checksum, digest = HEADER.unpack_from(buffer)
+        if (magic, version) != (MAGIC, VERSION):
+            return None
+        if checksum != source_checksum(data_dir):
+            return None
+        payload_start = HEADER.size
+        if digest != hashlib.sha256(buffer[payload_start:]).digest():
+            return None
+        return decode_assets(buffer)
+    except (OSError, ValueError, IndexError, struct.error):
+        return None
+
+
+@cache
+def load_assets() -> GameAssets:
+    assets = read_assets()
+    return compile_sources() if assets is None else assets
+
+
+def main() -> None:
+    assets = compile_assets()
+    print(
+        f"Compiled {len(assets.regions)} regions, {len(assets.cards)} cards and "
+        f"{len(assets.politics)} nations into {ASSET_PATH}"
+    )
+
+
+if __name__ == "__main__":
+    main()
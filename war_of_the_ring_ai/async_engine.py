@@ -0,0 +1,66 @@
+"""Concurrent games against slow or remote agents, driven from an asyncio event loop.
+
+The engine itself is synchronous. Each game runs in an AsyncGameEnv, which plays it on
+its own OS thread and delivers every decision to the event loop, where the agents are
+awaited. While one game waits on an agent, the others keep moving, and throughput
+scales with concurrency rather than latency. Each concurrent game costs one thread, so
+hundreds of concurrent games mean hundreds of threads.
+"""
+import asyncio
+import time
+from typing import Optional
+
+from war_of_the_ring_ai.agent import AsyncAgent, AsyncStrategy
+from war_of_the_ring_ai.env import AsyncGameEnv
+from war_of_the_ring_ai.game_objects import Side
+from war_of_the_ring_ai.game_random import GameRandom
+from war_of_the_ring_ai.simulate import GameResult
+
+
+async def play_game_async(
+    env: AsyncGameEnv, agents: dict[Side, AsyncAgent], seed: int, game: int
+) -> GameResult:
+    decisions = 0
+    start = time.perf_counter()
+    step = await env.reset_async(seed, game)
+    while not step.done:
+        assert step.side is not None and step.request is not None
+        option = await agents[step.side].choose(step.request)
+        step = await env.step_async(option)
+        decisions += 1
+    assert env.manager is not None
+    return GameResult(
+        seed,
+        game,
+        step.winner,
+        env.manager.turns,
+        decisions,
+        time.perf_counter() - start,
+        step.error,
+    )
+
+
+async def simulate_async(
+    games: int,
+    free: AsyncStrategy,
+    shadow: AsyncStrategy,
+    seed: Optional[int] = None,
+    concurrency: int = 100,
+) -> list[GameResult]:
+    # Results are returned in game order, and each game is seeded from (seed, game)
+    seed = GameRandom(seed).seed
+    remaining = iter(range(games))
+    results = []
+
+    async def worker() -> None:
+        env = AsyncGameEnv(seed)
+        agents = {
+            Side.FREE: AsyncAgent(Side.FREE.name, free, env.state.rng.agents),
+            Side.SHADOW: AsyncAgent(Side.SHADOW.name, shadow, env.state.rng.agents),
+        }
+        for game in remaining:
+            results.append(await play_game_async(env, agents, seed, game))
+        await env.close_async()
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, games))))
+    return sorted(results, key=lambda result: result.game)
@@ -0,0 +1,40 @@
+"""Compact record of the decisions made by agents.
+
+Each decision is stored as a tuple of (request type, chosen option index, option count)
+in a bounded ring buffer. Nothing is formatted when a decision is recorded. Formatting
+happens when the buffer is flushed, in bulk, and only if there is a sink to write to or
+debug logging is enabled for this module. Agents without a log skip recording entirely.
+"""
+import logging
+from collections import deque
+from typing import Optional, TextIO
+
+LOGGER = logging.getLogger(__name__)
+
+Decision = tuple[type, int, int]
+
+
+class DecisionLog:
+    def __init__(self, capacity: int = 4096, sink: Optional[TextIO] = None) -> None:
+        # Without a sink, only the most recent decisions are kept. With a sink, the
+        # buffer is flushed to it whenever it fills up.
+        self.events: deque[Decision] = deque(maxlen=capacity)
+        self.sink: Optional[TextIO] = sink
+
+    def record(self, request: type, choice: int, options: int) -> None:
+        if self.sink is not None and len(self.events) == self.events.maxlen:
+            self.flush()
+        self.events.append((request, choice, options))
+
+    def flush(self) -> None:
+        if self.sink is not None:
+            self.sink.write(self.format())
+        elif LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Decisions:\n%s", self.format())
+        self.events.clear()
+
+    def format(self) -> str:
+        return "".join(
+            f"{request.__name__} {choice}/{options}\n"
+            for request, choice, options in self.events
+        )
@@ -0,0 +1,216 @@
+"""Step-by-step environments for driving games from outside the engine.
+
+The game engine asks agents for decisions from deep inside its phase managers. To
+invert control, each game runs in its own thread with bridge agents on both sides, which
+hand every request to the caller and block until the caller chooses an option.
+GameEnv.reset() returns the first pending request of a new game, and step(option) plays
+until the next decision. VectorGameEnv steps N independent games in lockstep, and
+AsyncGameEnv awaits decisions from an asyncio event loop instead of blocking on them.
+"""
+import asyncio
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence, Union
+
+from war_of_the_ring_ai.agent import Agent
+from war_of_the_ring_ai.game_manager import GameManager
+from war_of_the_ring_ai.game_objects import Side
+from war_of_the_ring_ai.game_random import GameRandom
+from war_of_the_ring_ai.game_requests import Request
+from war_of_the_ring_ai.game_state import GameState
+from war_of_the_ring_ai.simulate import UNFINISHED_GAME_ERRORS
+
+ABANDON = -1
+
+
+class GameAbandoned(Exception):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class Step:
+    request: Optional[Request]  # The next pending decision, or None if the game is over
+    side: Optional[Side]  # The side to make that decision
+    done: bool = False
+    winner: Optional[Side] = None
+    error: Optional[str] = None  # Why the game ended early, if it did
+
+    def reward(self, side: Side) -> float:
+        if self.winner is None:
+            return 0.0
+        return 1.0 if self.winner == side else -1.0
+
+
+# Messages from the game thread are a pending decision, the end of the game, or an
+# unexpected engine error, which is raised to the caller
+Message = Union[tuple[Side, Request], Step, Exception]
+
+
+class GameEnv:
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.state = GameState(rng=GameRandom(seed))
+        self.seed = self.state.rng.seed
+        self.game = -1
+        self.last: Optional[Step] = None
+        self._decisions: queue.SimpleQueue[Message] = queue.SimpleQueue()
+        self._responses: queue.SimpleQueue[int] = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self.manager: Optional[GameManager] = None
+        for player in self.state.players:
+            player.agent = Agent(player.side.name, self._bridge_strategy(player.side))
+
+    def _bridge_strategy(self, side: Side) -> Any:
+        def strategy(request: Request, _: Any) -> Any:
+            self._post((side, request))
+            choice = self._responses.get()
+            if choice == ABANDON:
+                raise GameAbandoned()
+            return request.options[choice]
+
+        return strategy
+
+    def _post(self, message: Message) -> None:
+        # Called from the game thread
+        self._decisions.put(message)
+
+    def _play(self) -> None:
+        assert self.manager is not None
+        winner, error = None, None
+        try:
+            winner = self.manager.play()
+        except UNFINISHED_GAME_ERRORS as exception:
+            error = f"{type(exception).__name__}: {exception}"
+        except GameAbandoned:
+            error = "Game abandoned"
+        except Exception as exception:  # pylint: disable=broad-except
+            self._post(exception)
+            return
+        self._post(Step(None, None, True, winner, error))
+
+    def receive(self) -> Step:
+        # Waits for the next decision, or the end of the game
+        return self._handle(self._decisions.get())
+
+    def _handle(self, message: Message) -> Step:
+        if isinstance(message, tuple):
+            side, request = message
+            self.last = Step(request, side)
+            return self.last
+        assert self._thread is not None
+        self._thread.join()
+        self._thread = None
+        if isinstance(message, Exception):
+            self.last = None
+            raise message
+        self.last = message
+        return self.last
+
+    def reset(self, seed: Optional[int] = None, game: Optional[int] = None) -> Step:
+        # Starts game (seed, game), by default the next game of the current seed. A
+        # game that ends before its first decision is returned as a finished step.
+        self.close()
+        self._start(seed, game)
+        return self.receive()
+
+    def _start(self, seed: Optional[int], game: Optional[int]) -> None:
+        if seed is not None:
+            self.seed = seed
+        self.game = self.game + 1 if game is None else game
+        self.state.reset(self.seed, self.game)
+        self.manager = GameManager(self.state)
+        self._thread = threading.Thread(target=self._play, daemon=True)
+        self._thread.start()
+
+    def send(self, option: int) -> None:
+        # Answers the pending decision, without waiting for the next one
+        if self.last is None or self.last.request is None:
+            raise RuntimeError("There is no pending decision. Call reset() first.")
+        if not 0 <= option < len(self.last.request.options):
+            raise IndexError(f"Option {option} is out of range for {self.last}.")
+        self._responses.put(option)
+
+    def step(self, option: int) -> Step:
+        self.send(option)
+        return self.receive()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._responses.put(ABANDON)
+            self.receive()
+
+
+class AsyncGameEnv(GameEnv):
+    # Must be created inside a running event loop. The game still plays on its own
+    # thread, and decisions are delivered to the loop from there, so awaiting one never
+    # blocks other coroutines.
+    def __init__(self, seed: Optional[int] = None) -> None:
+        super().__init__(seed)
+        self._loop = asyncio.get_running_loop()
+        self._pending: asyncio.Queue[Message] = asyncio.Queue()
+
+    def _post(self, message: Message) -> None:
+        self._loop.call_soon_threadsafe(self._pending.put_nowait, message)
+
+    def receive(self) -> Step:
+        raise TypeError("AsyncGameEnv must be driven with its async methods.")
+
+    async def receive_async(self) -> Step:
+        return self._handle(await self._pending.get())
+
+    async def reset_async(
+        self, seed: Optional[int] = None, game: Optional[int] = None
+    ) -> Step:
+        await self.close_async()
+        self._start(seed, game)
+        return await self.receive_async()
+
+    async def step_async(self, option: int) -> Step:
+        self.send(option)
+        return await self.receive_async()
+
+    async def close_async(self) -> None:
+        if self._thread is not None:
+            self._responses.put(ABANDON)
+            await self.receive_async()
+
+
+class VectorGameEnv:
+    # Games of the seed are numbered in the order they start, which is deterministic.
+    # Finished games are reset automatically: their step is marked done, with the
+    # winner of the finished game and the first request of the next one.
+    def __init__(self, envs: int, seed: Optional[int] = None) -> None:
+        self.seed = GameRandom(seed).seed
+        self.envs = [GameEnv(self.seed) for _ in range(envs)]
+        self.next_game = 0
+
+    def _reset(self, env: GameEnv) -> Step:
+        step = env.reset(self.seed, self.next_game)
+        self.next_game += 1
+        return step
+
+    def reset(self) -> list[Step]:
+        self.next_game = 0
+        return [self._reset(env) for env in self.envs]
+
+    def step(self, options: Sequence[int]) -> list[Step]:
+        if len(options) != len(self.envs):
+            raise ValueError(f"Expected {len(self.envs)} options, got {len(options)}.")
+        # All games are sent their decision before any result is awaited, so they
+        # advance together.
+        for env, option in zip(self.envs, options):
+            env.send(option)
+        steps = []
+        for env in self.envs:
+            step = env.receive()
+            if step.done:
+                first = self._reset(env)
+                while first.done:
+                    first = self._reset(env)
+                step = Step(first.request, first.side, True, step.winner, step.error)
+            steps.append(step)
+        return steps
+
+    def close(self) -> None:
+        for env in self.envs:
+            env.close()
@@ -1,4 +1,3 @@
-import random
 from collections import Counter
 from typing import Optional, cast
 
@@ -6,7 +5,6 @@ from war_of_the_ring_ai.game_objects import (
     DIE,
     NATION_SIDE,
     Action,
-    Army,
     ArmyUnit,
     Casualty,
     CharacterID,
@@ -16,6 +14,7 @@ from war_of_the_ring_ai.game_objects import (
     Settlement,
     Side,
     UnitType,
+    army_unit,
 )
 from war_of_the_ring_ai.game_requests import (
     ArmyAction,
@@ -36,12 +35,14 @@ from war_of_the_ring_ai.game_requests import (
     MusterAction,
     MusterGandalfWhiteRegion,
     MusterLocation,
+    MusterMouthRegion,
     MusterWitchKingArmy,
     PalantirAction,
     PassTurn,
     PlayArmyEvent,
     PlayCharacterEvent,
     PlayMusterEvent,
+    Request,
     WillAction,
 )
 from war_of_the_ring_ai.game_state import (
@@ -55,9 +56,11 @@ from war_of_the_ring_ai.game_state import (
 class GameManager:
     def __init__(self, state: GameState) -> None:
         self.state: GameState = state
+        self.turns: int = 0
 
     def play(self) -> Side:
         while True:
+            self.turns += 1
             self.draw_phase()
             self.fellowship_phase()
             self.hunt_allocation_phase()
@@ -70,18 +73,18 @@ class GameManager:
     def draw_phase(self) -> None:
         for player in self.state.players:
             if player.character_deck:
-                player.hand.append(player.character_deck.pop())
+                self.state.draw_card(player, player.character_deck)
             if player.strategy_deck:
-                player.hand.append(player.strategy_deck.pop())
+                self.state.draw_card(player, player.strategy_deck)
             while len(player.hand) > 6:
-                player.hand.remove(player.agent.response(Discard(player.hand)))
+                self.state.discard(player, player.agent.response(Discard(player.hand)))
 
     def fellowship_phase(self) -> None:
         player = self.state.free_player
         fellowship = self.state.fellowship
 
         # Change guide
-        fellowship.guide = player.agent.response(ChangeGuide(fellowship.companions))
+        self.state.set_guide(player.agent.response(ChangeGuide(fellowship.companions)))
 
         # Declare fellowship
         if not fellowship.in_mordor() and not fellowship.revealed:
@@ -91,18 +94,16 @@ class GameManager:
                     DeclareFellowshipLocation(fellowship.location, fellowship.progress)
                 )
                 if declared_region.can_heal_fellowship():
-                    fellowship.corruption = max(0, fellowship.corruption - 1)
-                fellowship.location = declared_region
-                fellowship.progress = 0
+                    self.state.set_corruption(max(0, fellowship.corruption - 1))
+                self.state.set_fellowship_location(declared_region)
+                self.state.set_fellowship_progress(0)
 
         # Enter Mordor
         if not fellowship.in_mordor():
             assert fellowship.location
             if fellowship.location.can_enter_mordor():
                 if player.agent.response(EnterMordor()):
-                    fellowship.location = None
-                    fellowship.progress = 0
-                    self.state.hunt_pool.enter_mordor()
+                    self.state.enter_mordor()
 
     def hunt_allocation_phase(self) -> None:
         player = self.state.shadow_player
@@ -113,8 +114,8 @@ class GameManager:
                 companions=len(self.state.fellowship.companions),
             )
         )
-        self.state.hunt_box_character = 0
-        self.state.hunt_box_eyes = allocated_eyes
+        self.state.set_hunt_box_character(0)
+        self.state.set_hunt_box_eyes(allocated_eyes)
 
     def action_roll_phase(self) -> None:
         # Roll dice for both players
@@ -123,13 +124,20 @@ class GameManager:
                 Side.FREE: player.max_dice,
                 Side.SHADOW: player.max_dice - self.state.hunt_box_eyes,
             }
-            player.dice = Counter(
-                random.choice(DIE[player.side]) for _ in range(rollable[player.side])
+            self.state.set_dice(
+                player,
+                Counter(
+                    self.state.rng.dice.choice(DIE[player.side])
+                    for _ in range(rollable[player.side])
+                ),
             )
 
         # Add rolled eyes to the hunt box
-        self.state.hunt_box_eyes += self.state.shadow_player.dice[DieResult.EYE]
-        self.state.shadow_player.dice[DieResult.EYE] = 0
+        shadow_player = self.state.shadow_player
+        self.state.set_hunt_box_eyes(
+            self.state.hunt_box_eyes + shadow_player.dice[DieResult.EYE]
+        )
+        self.state.set_die_count(shadow_player, DieResult.EYE, 0)
 
     def action_resolution_phase(self) -> Optional[Side]:
         return TurnManager(self.state).play_turn()
@@ -177,95 +185,66 @@ class TurnManager:
                 )
             ),
         )
-        self.active_player.dice[action_die] -= 1
+        self.state.set_die_count(
+            self.active_player, action_die, self.active_player.dice[action_die] - 1
+        )
         return action_die
 
+    def character_action(self) -> CharacterAction:
+        return CharacterAction(
+            self.active_player.side,
+            self.state.fellowship,
+            self.state.regions,
+            legality=self.state.legality,
+        )
+
+    def army_action(self) -> ArmyAction:
+        return ArmyAction(
+            self.active_player.side, self.state.regions, legality=self.state.legality
+        )
+
+    def muster_action(self) -> MusterAction:
+        return MusterAction(
+            self.active_player.side,
+            self.state.regions,
+            self.state.politics,
+            self.state.reinforcements,
+            self.state.characters_mustered,
+            self.state.fellowship,
+            legality=self.state.legality,
+        )
+
+    def hybrid_action(self) -> HybridAction:
+        return HybridAction(self.army_action(), self.muster_action())
+
+    def will_action(self) -> WillAction:
+        return WillAction(
+            self.state.characters_mustered,
+            self.state.fellowship.companions,
+            self.state.character_locations,
+            self.character_action(),
+            self.hybrid_action(),
+            PalantirAction(self.active_player),
+        )
+
     def choose_action(self, action_die: DieResult) -> Action:
         # TODO This can be a match statement when mypy supports python 3.10
-        # TODO BUG: Action.SKIP gets added multiple times for some dice
+        request: Request
         if action_die == DieResult.CHARACTER:
-            return cast(
-                Action,
-                self.active_player.agent.response(
-                    CharacterAction(
-                        self.active_player.side,
-                        self.state.fellowship,
-                        self.state.regions,
-                    )
-                ),
-            )
-        if action_die == DieResult.ARMY:
-            return cast(
-                Action,
-                self.active_player.agent.response(
-                    ArmyAction(self.active_player.side, self.state.regions)
-                ),
-            )
-        if action_die == DieResult.MUSTER:
-            return cast(
-                Action,
-                self.active_player.agent.response(
-                    MusterAction(
-                        self.active_player.side,
-                        self.state.regions,
-                        self.state.politics,
-                        self.state.reinforcements,
-                        self.state.characters_mustered,
-                        self.state.fellowship,
-                    )
-                ),
-            )
-        if action_die == DieResult.PALANTIR:
-            return cast(
-                Action,
-                self.active_player.agent.response(PalantirAction(self.active_player)),
-            )
-        if action_die == DieResult.HYBRID:
-            return cast(
-                Action,
-                self.active_player.agent.response(
-                    HybridAction(
-                        ArmyAction(self.active_player.side, self.state.regions),
-                        MusterAction(
-                            self.active_player.side,
-                            self.state.regions,
-                            self.state.politics,
-                            self.state.reinforcements,
-                            self.state.characters_mustered,
-                            self.state.fellowship,
-                        ),
-                    )
-                ),
-            )
-        if action_die == DieResult.WILL:
-            return cast(
-                Action,
-                self.active_player.agent.response(
-                    WillAction(
-                        self.state.characters_mustered,
-                        self.state.fellowship.companions,
-                        self.state.regions,
-                        CharacterAction(
-                            self.active_player.side,
-                            self.state.fellowship,
-                            self.state.regions,
-                        ),
-                        HybridAction(
-                            ArmyAction(self.active_player.side, self.state.regions),
-                            MusterAction(
-                                self.active_player.side,
-                                self.state.regions,
-                                self.state.politics,
-                                self.state.reinforcements,
-                                self.state.characters_mustered,
-                                self.state.fellowship,
-                            ),
-                        ),
-                        PalantirAction(self.active_player),
-                    )
-                ),
-            )
-        raise ValueError(f"Unknown action die: {action_die}")
+            request = self.character_action()
+        elif action_die == DieResult.ARMY:
+            request = self.army_action()
+        elif action_die == DieResult.MUSTER:
+            request = self.muster_action()
+        elif action_die == DieResult.PALANTIR:
+            request = PalantirAction(self.active_player)
+        elif action_die == DieResult.HYBRID:
+            request = self.hybrid_action()
+        elif action_die == DieResult.WILL:
+            request = self.will_action()
+        else:
+            raise ValueError(f"Unknown action die: {action_die}")
+        return cast(Action, self.active_player.agent.response(request))
 
     def is_ring_victory(self) -> Optional[Side]:
         if self.state.fellowship.corruption >= 12:
@@ -305,56 +284,59 @@ class ActionManager:  # pylint: disable=too-many-public-methods
         return
 
     def draw_character_event(self) -> None:
-        self.player.hand.append(self.player.character_deck.pop())
+        self.state.draw_card(self.player, self.player.character_deck)
         while len(self.player.hand) > 6:
             discarded_card = self.player.agent.response(Discard(self.player.hand))
-            self.player.hand.remove(discarded_card)
+            self.state.discard(self.player, discarded_card)
 
     def draw_strategy_event(self) -> None:
-        self.player.hand.append(self.player.strategy_deck.pop())
+        self.state.draw_card(self.player, self.player.strategy_deck)
         while len(self.player.hand) > 6:
             discarded_card = self.player.agent.response(Discard(self.player.hand))
-            self.player.hand.remove(discarded_card)
+            self.state.discard(self.player, discarded_card)
 
     def play_character_event(self) -> None:
         card = self.player.agent.response(PlayCharacterEvent(self.player.hand))
-        self.player.hand.remove(card)
+        self.state.discard(self.player, card)
 
         if self.state.fellowship.guide.name == CharacterID.GANDALF_GREY:
             if self.player.character_deck:
-                self.player.hand.append(self.player.character_deck.pop())
+                self.state.draw_card(self.player, self.player.character_deck)
                 while len(self.player.hand) > 6:
-                    self.player.hand.remove(
-                        self.player.agent.response(Discard(self.player.hand))
+                    self.state.discard(
+                        self.player,
+                        self.player.agent.response(Discard(self.player.hand)),
                     )
 
     def play_army_event(self) -> None:
         card = self.player.agent.response(PlayArmyEvent(self.player.hand))
-        self.player.hand.remove(card)
+        self.state.discard(self.player, card)
         if self.state.fellowship.guide.name == CharacterID.GANDALF_GREY:
             if self.player.strategy_deck:
-                self.player.hand.append(self.player.strategy_deck.pop())
+                self.state.draw_card(self.player, self.player.strategy_deck)
                 while len(self.player.hand) > 6:
-                    self.player.hand.remove(
-                        self.player.agent.response(Discard(self.player.hand))
+                    self.state.discard(
+                        self.player,
+                        self.player.agent.response(Discard(self.player.hand)),
                     )
 
     def play_muster_event(self) -> None:
         card = self.player.agent.response(PlayMusterEvent(self.player.hand))
-        self.player.hand.remove(card)
+        self.state.discard(self.player, card)
         if self.state.fellowship.guide.name == CharacterID.GANDALF_GREY:
             if self.player.strategy_deck:
-                self.player.hand.append(self.player.strategy_deck.pop())
+                self.state.draw_card(self.player, self.player.strategy_deck)
                 while len(self.player.hand) > 6:
-                    self.player.hand.remove(
-                        self.player.agent.response(Discard(self.player.hand))
+                    self.state.discard(
+                        self.player,
+                        self.player.agent.response(Discard(self.player.hand)),
                     )
 
     def diplomacy(self) -> None:
         nation = self.player.agent.response(
             Diplomacy(self.player.side, self.state.politics)
         )
-        self.state.politics[nation].disposition -= 1
+        self.state.set_disposition(nation, self.state.politics[nation].disposition - 1)
 
     def _muster(self, unit_type: UnitType, exclude: Optional[Region] = None) -> Region:
         region: Region = self.player.agent.response(
@@ -368,10 +350,14 @@ class ActionManager:  # pylint: disable=too-many-public-methods
         )
         if region.nation is None:
             raise ValueError(f"Attempted to muster in {region.name}.")
-        if region.army is None:
-            region.army = Army(self.player.side, region)
-        region.army.units.append(ArmyUnit(unit_type, region.nation))
-        self.state.reinforcements[region.nation][unit_type.value] -= 1
+        self.state.add_units(
+            region, self.player.side, [army_unit(unit_type, region.nation)]
+        )
+        self.state.set_reinforcements(
+            region.nation,
+            unit_type,
+            self.state.reinforcements[region.nation][unit_type.value] - 1,
+        )
         return region
 
     def muster_elite(self) -> None:
@@ -391,27 +377,21 @@ class ActionManager:  # pylint: disable=too-many-public-methods
 
     def muster_saruman(self) -> None:
         saruman = ALL_MINIONS[CharacterID.SARUMAN]
-        self.state.characters_mustered.add(saruman)
+        self.state.add_mustered(saruman)
         orthanc = self.state.regions.with_name("Orthanc")
-        if orthanc.army is not None:
-            orthanc.army.characters.append(saruman)
-        else:
-            orthanc.army = Army(Side.SHADOW, orthanc, characters=[saruman])
+        self.state.add_character(orthanc, Side.SHADOW, saruman)
 
     def muster_witch_king(self) -> None:
         witch_king = ALL_MINIONS[CharacterID.WITCH_KING]
-        self.state.characters_mustered.add(witch_king)
+        self.state.add_mustered(witch_king)
         army = self.player.agent.response(MusterWitchKingArmy(self.state.regions))
-        army.characters.append(witch_king)
+        self.state.add_character(army.region, Side.SHADOW, witch_king)
 
     def muster_mouth_of_sauron(self) -> None:
         mouth = ALL_MINIONS[CharacterID.MOUTH_OF_SAURON]
-        self.state.characters_mustered.add(mouth)
-        region = self.player.agent.response(MusterWitchKingArmy(self.state.regions))
-        if region.army is not None:
-            region.army.characters.append(mouth)
-        else:
-            region.army = Army(Side.SHADOW, region, characters=[mouth])
+        self.state.add_mustered(mouth)
+        region = self.player.agent.response(MusterMouthRegion(self.state.regions))
+        self.state.add_character(region, Side.SHADOW, mouth)
 
     def _request_army_movement(self, leader: bool) -> tuple[list[ArmyUnit], Region]:
         army = self.player.agent.response(
@@ -419,16 +399,13 @@ class ActionManager:  # pylint: disable=too-many-public-methods
         )
         destination = self.player.agent.response(MoveArmyDestination(army))
         units = self.player.agent.response(MoveArmyUnits(army, leader))
-        for unit in units:
-            army.units.remove(unit)
+        self.state.remove_units(army.region, units)
         return units, destination
 
     def _execute_army_movement(
         self, units: list[ArmyUnit], destination: Region
     ) -> None:
-        if destination.army is None:
-            destination.army = Army(self.player.side, destination)
-        destination.army.units.extend(units)
+        self.state.add_units(destination, self.player.side, units)
         # TODO Disband here if stacking limit is exceeded
 
     def move_armies(self) -> None:
@@ -447,13 +424,13 @@ class ActionManager:  # pylint: disable=too-many-public-methods
         raise NotImplementedError()
 
     def move_fellowship(self) -> None:
-        self.state.fellowship.progress += 1
+        self.state.set_fellowship_progress(self.state.fellowship.progress + 1)
         HuntManager(self.state).hunt()
-        self.state.hunt_box_character += 1
+        self.state.set_hunt_box_character(self.state.hunt_box_character + 1)
 
     def hide_fellowship(self) -> None:
         # TODO Strider's Guide ability (should allow this action from any die)
-        self.state.fellowship.revealed = False
+        self.state.set_revealed(False)
 
     def separate_companions(self) -> None:
         raise NotImplementedError()
@@ -466,22 +443,17 @@ class ActionManager:  # pylint: disable=too-many-public-methods
 
     def muster_gandalf(self) -> None:
         gandalf = ALL_COMPANIONS[CharacterID.GANDALF_WHITE]
-        self.state.characters_mustered.add(gandalf)
+        self.state.add_mustered(gandalf)
         region = self.player.agent.response(
             MusterGandalfWhiteRegion(self.state.regions)
         )
-        if region.army is not None:
-            region.army.characters.append(gandalf)
-        else:
-            region.army = Army(Side.FREE, region, characters=[gandalf])
+        self.state.add_character(region, Side.FREE, gandalf)
 
     def muster_aragorn(self) -> None:
         aragorn = ALL_COMPANIONS[CharacterID.ARAGORN]
-        self.state.characters_mustered.add(aragorn)
-        region = self.state.regions.with_character(CharacterID.STRIDER)
-        if region.army is not None:
-            region.army.characters.remove(ALL_COMPANIONS[CharacterID.STRIDER])
-            region.army.characters.append(aragorn)
+        self.state.add_mustered(aragorn)
+        region = self.state.remove_character(ALL_COMPANIONS[CharacterID.STRIDER])
+        self.state.add_character(region, Side.FREE, aragorn)
 
 
 class HuntManager:
@@ -518,13 +490,12 @@ class HuntManager:
 
     def hunt_roll(self) -> int:
         hit_result = 6 - self.state.hunt_box_character
-        hunt_roll_results = [
-            random.randint(1, 6) for _ in range(self.state.hunt_box_eyes)
-        ]
+        rng = self.state.rng.hunt
+        hunt_roll_results = [rng.randint(1, 6) for _ in range(self.state.hunt_box_eyes)]
         hits = sum(1 for i in hunt_roll_results if i >= hit_result)
         misses = len(hunt_roll_results) - hits
         max_rerolls = self.get_reroll_count()
-        reroll_results = [random.randint(1, 6) for _ in range(min(misses, max_rerolls))]
+        reroll_results = [rng.randint(1, 6) for _ in range(min(misses, max_rerolls))]
         hits += sum(1 for i in reroll_results if i >= hit_result)
         return hits
 
@@ -534,19 +505,19 @@ class HuntManager:
         return hits
 
     def draw_tile(self, hits: int = 0) -> int:
-        tile = self.state.hunt_pool.draw()
+        tile = self.state.draw_hunt_tile()
 
         if tile.side == Side.SHADOW:
-            self.state.fellowship.progress -= 1
+            self.state.set_fellowship_progress(self.state.fellowship.progress - 1)
 
         if tile.reveal:
-            self.state.fellowship.revealed = True
+            self.state.set_revealed(True)
 
         if tile.is_eye():
             corruption = self.eye_corruption(hits)
-            self.state.hunt_pool.reserve.append(tile)
+            self.state.reserve_hunt_tile(tile)
         elif tile.is_shelob():
-            corruption = random.randint(1, 6)
+            corruption = self.state.rng.hunt.randint(1, 6)
         else:
             corruption = tile.corruption
 
@@ -558,7 +529,7 @@ class HuntManager:
         if strategy == Casualty.GUIDE:
             return self.state.fellowship.guide
         if strategy == Casualty.RANDOM:
-            return random.choice(self.state.fellowship.companions)
+            return self.state.rng.hunt.choice(self.state.fellowship.companions)
         return None
 
     def hunt(self) -> None:
@@ -577,12 +548,12 @@ class HuntManager:
                 guide = self.state.free_player.agent.response(
                     ChangeGuide(self.state.fellowship.companions, casualty)
                 )
-                self.state.fellowship.guide = guide
-                self.state.fellowship.companions.remove(casualty)
+                self.state.set_guide(guide)
+                self.state.remove_companion(casualty)
 
-        self.state.fellowship.corruption += corruption
+        self.state.set_corruption(self.state.fellowship.corruption + corruption)
 
 
-if __name__ != "__main__()":
+if __name__ == "__main__":
     game = GameManager(GameState())
     game.play()
@@ -1,7 +1,7 @@
 import random
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 
 
 class Side(Enum):
@@ -141,7 +141,10 @@ DIE = {
 }
 
 
-@dataclass
+# Regions are singletons within their map, so they compare by identity. Comparing
+# fields would recurse through neighbors and armies, and regions of a cloned map would
+# equal their originals.
+@dataclass(slots=True, eq=False)
 class Region:
     name: str
     neighbors: list["Region"] = field(repr=False)
@@ -149,9 +152,16 @@ class Region:
     settlement: Optional[Settlement] = None
     army: Optional["Army"] = None
     is_conquered: bool = field(default=False)
+    region_map: Optional["RegionMap"] = field(default=None, repr=False)
+    id: int = field(default=-1, repr=False)
+    neighbor_mask: int = field(default=0, repr=False)
 
     def __hash__(self) -> int:
-        return hash(self.name)
+        return self.id
+
+    @property
+    def mask(self) -> int:
+        return 1 << self.id
 
     def __repr__(self) -> str:
         army_repr = (
@@ -206,30 +216,253 @@ class Region:
         return self.name in ("Morannon", "Minas Morgul")
 
     def reachable_regions(self, distance: int) -> set["Region"]:
-        return self._reachable_region_search(distance, {self}, {self})
-
-    def _reachable_region_search(
-        self, distance: int, search: set["Region"], reached: set["Region"]
-    ) -> set["Region"]:
-        if distance == 0:
-            return reached
-
-        next_search = {
-            neighbor
-            for region in search
-            for neighbor in region.neighbors
-            if neighbor not in reached
-        }
-        reached |= next_search
-        return self._reachable_region_search(distance - 1, next_search, reached)
+        if self.region_map is None:
+            raise ValueError(f"Region {self.name} does not belong to a region map.")
+        return self.region_map.reachable_regions(self, distance)
 
 
 @dataclass
-class RegionMap:
+class RegionMap:  # pylint: disable=too-many-instance-attributes
     regions_by_name: dict[str, Region] = field(default_factory=dict)
+    regions: list[Region] = field(default_factory=list, repr=False)
+
+    # Regions are assigned dense integer IDs in insertion order, so any set of regions
+    # can be represented as an integer bitmask with bit i set for the region with ID i.
+    nation_masks: dict[Nation, int] = field(
+        default_factory=lambda: {nation: 0 for nation in Nation}, repr=False
+    )
+    side_masks: dict[Side, int] = field(
+        default_factory=lambda: {side: 0 for side in Side}, repr=False
+    )
+    conquered_mask: int = field(default=0, repr=False)
+
+    # Indexes of regions occupied by each side's army units and characters. These are
+    # kept up to date by the unit and character mutators below, which the game engine
+    # must use instead of modifying armies directly.
+    army_masks: dict[Side, int] = field(
+        default_factory=lambda: {side: 0 for side in Side}, repr=False
+    )
+    character_masks: dict[Side, int] = field(
+        default_factory=lambda: {side: 0 for side in Side}, repr=False
+    )
+
+    # The frontier of each side: regions holding an army of that side with at least one
+    # legal move, and with at least one enemy army to attack. An army's moves and
+    # attacks depend only on its own region and its neighbors, so a change to a region
+    # updates the frontier of that region and its neighbors alone.
+    move_masks: dict[Side, int] = field(
+        default_factory=lambda: {side: 0 for side in Side}, repr=False
+    )
+    attack_masks: dict[Side, int] = field(
+        default_factory=lambda: {side: 0 for side in Side}, repr=False
+    )
+
+    distances: list[bytes] = field(default_factory=list, repr=False)
+    reachable: list[list[int]] = field(default_factory=list, repr=False)
 
     def insert(self, region: Region) -> None:
+        region.id = len(self.regions)
+        region.region_map = self
+        self.regions.append(region)
         self.regions_by_name[region.name] = region
+        if region.nation is not None:
+            self.nation_masks[region.nation] |= region.mask
+            for side, nations in NATION_SIDE.items():
+                if region.nation in nations:
+                    self.side_masks[side] |= region.mask
+        if region.is_conquered:
+            self.conquered_mask |= region.mask
+        self.update_indexes(region)
+
+    def update_indexes(self, region: Region) -> None:
+        for side in Side:
+            self.army_masks[side] &= ~region.mask
+            self.character_masks[side] &= ~region.mask
+        if region.army is not None:
+            if region.army.has_units():
+                self.army_masks[region.army.side] |= region.mask
+            if region.army.has_characters():
+                self.character_masks[region.army.side] |= region.mask
+        self.update_frontier(region.mask | region.neighbor_mask)
+
+    def update_frontier(self, mask: int) -> None:
+        for side in Side:
+            enemy = Side.SHADOW if side == Side.FREE else Side.FREE
+            free_for_movement = self.free_for_movement_mask(side)
+            enemy_armies = self.army_masks[enemy]
+            move_mask = self.move_masks[side] & ~mask
+            attack_mask = self.attack_masks[side] & ~mask
+            for region in self.regions_in(mask & self.army_masks[side]):
+                if region.neighbor_mask & free_for_movement:
+                    move_mask |= region.mask
+                if region.neighbor_mask & enemy_armies:
+                    attack_mask |= region.mask
+            self.move_masks[side] = move_mask
+            self.attack_masks[side] = attack_mask
+
+    def add_units(self, region: Region, side: Side, units: list["ArmyUnit"]) -> None:
+        if region.army is None or (region.army.side != side and region.army.is_empty()):
+            region.army = Army(side, region)
+        for unit in units:
+            region.army.add(unit)
+        self.update_indexes(region)
+
+    def remove_units(self, region: Region, units: list["ArmyUnit"]) -> None:
+        if region.army is None:
+            raise ValueError(f"No army in {region.name} to remove units from.")
+        for unit in units:
+            region.army.remove(unit)
+        self.update_indexes(region)
+
+    def add_character(self, region: Region, side: Side, character: "Character") -> None:
+        if region.army is None or (region.army.side != side and region.army.is_empty()):
+            region.army = Army(side, region)
+        region.army.characters.append(character)
+        self.update_indexes(region)
+
+    def remove_character(self, region: Region, character: "Character") -> None:
+        if region.army is None:
+            raise ValueError(f"No army in {region.name} to remove characters from.")
+        region.army.characters.remove(character)
+        self.update_indexes(region)
+
+    def reset(self, template: "RegionMap") -> None:
+        # Restores armies and conquest from a map with the same topology, reusing the
+        # existing regions and armies.
+        for region, original in zip(self.regions, template.regions):
+            region.is_conquered = original.is_conquered
+            if original.army is None:
+                region.army = None
+            elif region.army is None:
+                region.army = original.army.clone(region)
+            else:
+                region.army.restore(original.army)
+        self.conquered_mask = template.conquered_mask
+        self.army_masks.update(template.army_masks)
+        self.character_masks.update(template.character_masks)
+        self.move_masks.update(template.move_masks)
+        self.attack_masks.update(template.attack_masks)
+
+    def clone(self) -> "RegionMap":
+        # Only armies and conquest change during a game. The name lookup is rebuilt,
+        # but the topology tables and static masks are shared with the original.
+        region_map = RegionMap(
+            nation_masks=self.nation_masks,
+            side_masks=self.side_masks,
+            conquered_mask=self.conquered_mask,
+            army_masks=dict(self.army_masks),
+            character_masks=dict(self.character_masks),
+            move_masks=dict(self.move_masks),
+            attack_masks=dict(self.attack_masks),
+            distances=self.distances,
+            reachable=self.reachable,
+        )
+        for region in self.regions:
+            copy = Region(
+                region.name,
+                [],
+                region.nation,
+                region.settlement,
+                None,
+                region.is_conquered,
+                region_map,
+                region.id,
+                region.neighbor_mask,
+            )
+            if region.army is not None:
+                copy.army = region.army.clone(copy)
+            region_map.regions.append(copy)
+            region_map.regions_by_name[copy.name] = copy
+        for region in self.regions:
+            region_map.regions[region.id].neighbors = [
+                region_map.regions[neighbor.id] for neighbor in region.neighbors
+            ]
+        return region_map
+
+    def build_tables(self, distances: list[bytes]) -> None:
+        # The map topology never changes, so distances between regions are computed
+        # ahead of time. The reachable table holds, for each region, the mask of regions
+        # within k steps at index k, up to the furthest region on the map.
+        self.distances = distances
+        self.reachable = []
+        for region in self.regions:
+            region.neighbor_mask = self.mask_of(region.neighbors)
+            by_distance = [0] * (max(distances[region.id]) + 1)
+            for other, distance in enumerate(distances[region.id]):
+                by_distance[distance] |= 1 << other
+            reachable = []
+            mask = 0
+            for ring in by_distance:
+                mask |= ring
+                reachable.append(mask)
+            self.reachable.append(reachable)
+        self.update_frontier(self.all_mask())
+
+    def all_mask(self) -> int:
+        return (1 << len(self.regions)) - 1
+
+    def mask_of(self, regions: Iterable[Region]) -> int:
+        mask = 0
+        for region in regions:
+            mask |= region.mask
+        return mask
+
+    def regions_in(self, mask: int) -> list[Region]:
+        regions = []
+        while mask:
+            lowest = mask & -mask
+            regions.append(self.regions[lowest.bit_length() - 1])
+            mask ^= lowest
+        return regions
+
+    def distance(self, origin: Region, destination: Region) -> int:
+        return self.distances[origin.id][destination.id]
+
+    def reachable_mask(self, origin: Region, distance: int) -> int:
+        reachable = self.reachable[origin.id]
+        return reachable[max(0, min(distance, len(reachable) - 1))]
+
+    def reachable_regions(self, origin: Region, distance: int) -> set[Region]:
+        return set(self.regions_in(self.reachable_mask(origin, distance)))
+
+    def set_conquered(self, region: Region, conquered: bool) -> None:
+        region.is_conquered = conquered
+        if conquered:
+            self.conquered_mask |= region.mask
+        else:
+            self.conquered_mask &= ~region.mask
+        self.update_frontier(region.mask | region.neighbor_mask)
+
+    def controlled_mask(self, side: Side) -> int:
+        enemy = Side.SHADOW if side == Side.FREE else Side.FREE
+        return (self.side_masks[side] & ~self.conquered_mask) | (
+            self.side_masks[enemy] & self.conquered_mask
+        )
+
+    def army_mask(self, side: Side) -> int:
+        return self.army_masks[side]
+
+    def free_mask(self, side: Side) -> int:
+        # Mirrors Region.is_free over every region at once
+        enemy = Side.SHADOW if side == Side.FREE else Side.FREE
+        enemy_controlled = self.controlled_mask(enemy)
+        return (enemy_controlled & self.army_mask(side)) | (
+            self.all_mask() & ~enemy_controlled & ~self.army_mask(enemy)
+        )
+
+    def free_for_movement_mask(self, side: Side) -> int:
+        # Mirrors Region.is_free_for_movement over every region at once
+        occupied = self.army_mask(Side.FREE) | self.army_mask(Side.SHADOW)
+        return self.free_mask(side) | (self.all_mask() & ~occupied)
+
+    def character_mask(self, side: Side) -> int:
+        return self.character_masks[side]
+
+    def move_mask(self, side: Side) -> int:
+        return self.move_masks[side]
+
+    def attack_mask(self, side: Side) -> int:
+        return self.attack_masks[side]
 
     def with_predicate(self, predicate: Callable[[Region], bool]) -> set[Region]:
         return {region for region in self.regions_by_name.values() if predicate(region)}
@@ -238,40 +471,36 @@ class RegionMap:
         return self.regions_by_name[name]
 
     def with_side(self, side: Side) -> set[Region]:
-        return self.with_predicate(
-            lambda r: r.nation is not None and r.nation in NATION_SIDE[side]
-        )
+        return set(self.regions_in(self.side_masks[side]))
 
     def with_nation(self, nation: Nation) -> set[Region]:
-        return self.with_predicate(lambda r: r.nation == nation)
+        return set(self.regions_in(self.nation_masks[nation]))
 
     def with_army_units(self, side: Optional[Side] = None) -> set[Region]:
         if side:
-            return self.with_predicate(
-                lambda r: r.army is not None
-                and r.army.has_units()
-                and r.army.side == side
-            )
-        return self.with_predicate(lambda r: r.army is not None and r.army.has_units())
+            return set(self.regions_in(self.army_masks[side]))
+        return set(
+            self.regions_in(self.army_masks[Side.FREE] | self.army_masks[Side.SHADOW])
+        )
 
     def with_characters(self, side: Optional[Side] = None) -> set[Region]:
         if side:
-            return self.with_predicate(
-                lambda r: r.army is not None
-                and r.army.has_characters()
-                and r.army.side == side
+            return set(self.regions_in(self.character_masks[side]))
+        return set(
+            self.regions_in(
+                self.character_masks[Side.FREE] | self.character_masks[Side.SHADOW]
             )
-        return self.with_predicate(
-            lambda r: r.army is not None and r.army.has_characters()
         )
 
     def with_character(self, character: CharacterID) -> Region:
-        return self.with_predicate(
-            lambda r: r.army is not None and r.army.has_character(character)
-        ).pop()
+        mask = self.character_masks[Side.FREE] | self.character_masks[Side.SHADOW]
+        for region in self.regions_in(mask):
+            if region.army is not None and region.army.has_character(character):
+                return region
+        raise KeyError(f"Character {character.name} is not on the map.")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Character:
     name: CharacterID
     level: int
@@ -281,19 +510,17 @@ class Character:
         return hash(self.name)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Companion(Character):
-    def __hash__(self) -> int:  # pylint: disable=useless-super-delegation
-        return super().__hash__()
+    __hash__ = Character.__hash__
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Minion(Character):
-    def __hash__(self) -> int:  # pylint: disable=useless-super-delegation
-        return super().__hash__()
+    __hash__ = Character.__hash__
 
 
-@dataclass
+@dataclass(slots=True)
 class Fellowship:
     companions: list[Companion]
     guide: Companion
@@ -305,14 +532,24 @@ class Fellowship:
     def in_mordor(self) -> bool:
         return self.location is None
 
+    def clone(self, location: Optional[Region]) -> "Fellowship":
+        return Fellowship(
+            list(self.companions),
+            self.guide,
+            location,
+            self.revealed,
+            self.progress,
+            self.corruption,
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class ElvenRings:
     free: int = 3
     shadow: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PoliticalStatus:
     disposition: int
     active: bool
@@ -328,7 +565,7 @@ class PoliticalStatus:
         return False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Card:
     event_name: str
     combat_name: str
@@ -336,39 +573,112 @@ class Card:
     category: CardCategory
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArmyUnit:
     type: UnitType
     nation: Nation
+    slot: int = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "slot", self.nation.value * len(UnitType) + self.type.value
+        )
 
-@dataclass
+
+UNIT_SLOTS = len(Nation) * len(UnitType)
+
+# Army units carry no state beyond their type and nation, so a single shared instance
+# of each is reused everywhere, indexed by slot.
+ARMY_UNITS = tuple(
+    ArmyUnit(unit_type, nation) for nation in Nation for unit_type in UnitType
+)
+
+
+def army_unit(unit_type: UnitType, nation: Nation) -> ArmyUnit:
+    return ARMY_UNITS[nation.value * len(UnitType) + unit_type.value]
+
+
+@dataclass(slots=True)
 class Army:
     side: Side
     region: Region
-    units: list[ArmyUnit] = field(default_factory=list)
     characters: list[Character] = field(default_factory=list)
 
+    # Units are stored as counts per (nation, unit type) slot, with running totals per
+    # unit type, so that aggregate queries and adding or removing units are O(1).
+    unit_counts: list[int] = field(default_factory=lambda: [0] * UNIT_SLOTS)
+    type_counts: list[int] = field(default_factory=lambda: [0] * len(UnitType))
+
+    @property
+    def units(self) -> list[ArmyUnit]:
+        return [unit for unit, count in self.unit_stacks() for _ in range(count)]
+
+    def unit_stacks(self) -> list[tuple[ArmyUnit, int]]:
+        return [
+            (ARMY_UNITS[slot], count)
+            for slot, count in enumerate(self.unit_counts)
+            if count > 0
+        ]
+
+    def count(self, unit: ArmyUnit) -> int:
+        return self.unit_counts[unit.slot]
+
+    def add(self, unit: ArmyUnit, count: int = 1) -> None:
+        self.unit_counts[unit.slot] += count
+        self.type_counts[unit.type.value] += count
+
+    def remove(self, unit: ArmyUnit, count: int = 1) -> None:
+        if self.unit_counts[unit.slot] < count:
+            raise ValueError(f"Army in {self.region.name} has too few {unit}.")
+        self.unit_counts[unit.slot] -= count
+        self.type_counts[unit.type.value] -= count
+
+    def clone(self, region: Region) -> "Army":
+        return Army(
+            self.side,
+            region,
+            list(self.characters),
+            list(self.unit_counts),
+            list(self.type_counts),
+        )
+
+    def restore(self, other: "Army") -> None:
+        self.side = other.side
+        self.characters[:] = other.characters
+        self.unit_counts[:] = other.unit_counts
+        self.type_counts[:] = other.type_counts
+
     def has_units(self) -> bool:
-        return len(self.units) > 0
+        return any(self.type_counts)
+
+    def has_nation(self, nation: Nation) -> bool:
+        start = nation.value * len(UnitType)
+        end = start + len(UnitType)
+        return any(self.unit_counts[start:end])
 
     def has_characters(self) -> bool:
         return len(self.characters) > 0
 
+    def is_empty(self) -> bool:
+        return not self.has_units() and not self.has_characters()
+
     def has_character(self, character: CharacterID) -> bool:
-        return character in {c.name for c in self.characters}
+        return any(c.name == character for c in self.characters)
 
     def regulars(self) -> int:
-        return sum(1 for unit in self.units if unit.type == UnitType.REGULAR)
+        return self.type_counts[UnitType.REGULAR.value]
 
     def elites(self) -> int:
-        return sum(1 for unit in self.units if unit.type == UnitType.ELITE)
+        return self.type_counts[UnitType.ELITE.value]
 
     def leaders(self) -> int:
-        return sum(1 for unit in self.units if unit.type == UnitType.LEADER)
+        return self.type_counts[UnitType.LEADER.value]
 
     def size(self) -> int:
-        return self.regulars() + self.elites()
+        return (
+            self.type_counts[UnitType.REGULAR.value]
+            + self.type_counts[UnitType.ELITE.value]
+        )
 
     def valid_moves(self) -> list[Region]:
         return [
@@ -391,7 +701,7 @@ class Army:
         return self.leaders() + character_leadership
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HuntTile:
     corruption: int
     reveal: bool
@@ -404,18 +714,18 @@ class HuntTile:
         return self.corruption == 200
 
 
-@dataclass
+@dataclass(slots=True)
 class HuntPool:
     tiles: list[HuntTile]
     reserve: list[HuntTile] = field(default_factory=list)
 
-    def __post_init__(self) -> None:
-        random.shuffle(self.tiles)
+    def clone(self) -> "HuntPool":
+        return HuntPool(list(self.tiles), list(self.reserve))
 
     def draw(self) -> HuntTile:
         return self.tiles.pop()
 
-    def enter_mordor(self) -> None:
+    def enter_mordor(self, rng: random.Random) -> None:
         self.tiles.extend(self.reserve)
         self.reserve = []
-        random.shuffle(self.tiles)
+        rng.shuffle(self.tiles)
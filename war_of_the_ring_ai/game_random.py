@@ -0,0 +1,40 @@
+"""Random number streams owned by a single game.
+
+Each game draws from its own generators instead of the global random module, with an
+independent stream for each source of randomness. Every stream is derived from the
+batch seed and the index of the game within the batch, so any game can be replayed
+exactly from (seed, game), regardless of which worker played it or in what order.
+"""
+import random
+import secrets
+from typing import Optional
+
+STREAMS = ("dice", "decks", "hunt", "agents")
+
+
+class GameRandom:  # pylint: disable=too-few-public-methods
+    __slots__ = ("seed", "game", *STREAMS)
+
+    def __init__(self, seed: Optional[int] = None, game: int = 0) -> None:
+        self.dice = random.Random()  # Action dice
+        self.decks = random.Random()  # Event deck shuffles
+        self.hunt = random.Random()  # Hunt rolls, hunt pool shuffles and casualties
+        self.agents = random.Random()  # Choices made by agents
+        self.reseed(seed, game)
+
+    def reseed(self, seed: Optional[int] = None, game: int = 0) -> None:
+        # Without a seed, one is chosen at random and kept, so the game is replayable
+        self.seed: int = secrets.randbits(64) if seed is None else seed
+        self.game: int = game
+        for name in STREAMS:
+            stream: random.Random = getattr(self, name)
+            stream.seed(f"{self.seed}/{game}/{name}")
+
+    def clone(self) -> "GameRandom":
+        rng = GameRandom.__new__(GameRandom)
+        rng.seed, rng.game = self.seed, self.game
+        for name in STREAMS:
+            stream = random.Random()
+            stream.setstate(getattr(self, name).getstate())
+            setattr(rng, name, stream)
+        return rng
@@ -1,6 +1,5 @@
 from dataclasses import dataclass, field
-from itertools import combinations
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Sequence, TypeVar, overload
 
 from war_of_the_ring_ai.game_objects import (
     NATION_SIDE,
@@ -23,20 +22,97 @@ from war_of_the_ring_ai.game_objects import (
     Side,
     UnitType,
 )
-from war_of_the_ring_ai.game_state import ALL_COMPANIONS, ALL_MINIONS, PlayerState
+from war_of_the_ring_ai.game_state import (
+    ALL_COMPANIONS,
+    ALL_MINIONS,
+    Concern,
+    LegalityCache,
+    PlayerState,
+)
+
+ARAGORN_MUSTER_REGIONS = ("Dol Amroth", "Pelargir", "Minas Tirith")
+
+# An action mask has bit Action.value set for each legal action
+ACTIONS = tuple(Action)
+SKIP = 1 << Action.SKIP.value
+PLAY_EVENT = {
+    CardCategory.CHARACTER: 1 << Action.PLAY_CHARACTER_EVENT.value,
+    CardCategory.ARMY: 1 << Action.PLAY_ARMY_EVENT.value,
+    CardCategory.MUSTER: 1 << Action.PLAY_MUSTER_EVENT.value,
+}
 
 
 @dataclass
 class Request:
-    options: list[Any] = field(init=False)
+    # Options are built on first access and kept, so a request can be shared between
+    # several composite requests while its legality checks run at most once.
+    _options: Optional[Sequence[Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # The state's cache of legality checks. Without one, checks are always evaluated.
+    legality: Optional[LegalityCache] = field(
+        default=None, kw_only=True, repr=False, compare=False
+    )
+
+    @property
+    def options(self) -> Sequence[Any]:
+        if self._options is None:
+            self._options = self.build_options()
+        return self._options
+
+    def build_options(self) -> Sequence[Any]:
+        raise NotImplementedError()
+
+
+RequestT = TypeVar("RequestT", bound=Request)
+T = TypeVar("T")
+
+
+def legality_check(
+    *concerns: Concern,
+) -> Callable[[Callable[[RequestT], T]], Callable[[RequestT], T]]:
+    # Memoizes a legality check against the versions of the concerns it depends on,
+    # for each side if the request has one
+    def decorator(check: Callable[[RequestT], T]) -> Callable[[RequestT], T]:
+        name = check.__qualname__
+
+        def memoized(request: RequestT) -> T:
+            if request.legality is None:
+                return check(request)
+            key = name, getattr(request, "side", None)
+            return request.legality.memoize(key, concerns, lambda: check(request))
+
+        return memoized
+
+    return decorator
+
+
+def actions_in(mask: int) -> list[Action]:
+    actions = []
+    while mask:
+        lowest = mask & -mask
+        actions.append(ACTIONS[lowest.bit_length() - 1])
+        mask ^= lowest
+    return actions
+
+
+@dataclass
+class ActionRequest(Request):
+    # Choices of an action for a die. The legal actions are computed as an action mask
+    # straight from the state, and the options are the legal actions in Action order.
+    def action_mask(self) -> int:
+        raise NotImplementedError()
+
+    def build_options(self) -> list[Action]:
+        return actions_in(self.action_mask())
 
 
 @dataclass
 class Discard(Request):
     hand: list[Card]
 
-    def __post_init__(self) -> None:
-        self.options: list[Card] = self.hand
+    def build_options(self) -> list[Card]:
+        return self.hand
 
 
 @dataclass
@@ -44,21 +120,21 @@ class ChangeGuide(Request):
     companions: list[Companion]
     casualty: Optional[Companion] = None
 
-    def __post_init__(self) -> None:
-        max_level = max(companion.level for companion in self.companions)
-        self.options: list[Companion] = [
-            companion for companion in self.companions if companion.level == max_level
+    def build_options(self) -> list[Companion]:
+        # The new guide is one of the highest level companions left after the casualty
+        companions = [
+            companion for companion in self.companions if companion != self.casualty
         ]
-        if self.casualty is not None:
-            self.options.remove(self.casualty)
-        if len(self.options) == 0:
-            self.options.append(ALL_COMPANIONS[CharacterID.GOLLUM])
+        if not companions:
+            return [ALL_COMPANIONS[CharacterID.GOLLUM]]
+        max_level = max(companion.level for companion in companions)
+        return [companion for companion in companions if companion.level == max_level]
 
 
 @dataclass
 class DeclareFellowship(Request):
-    def __post_init__(self) -> None:
-        self.options: list[bool] = [True, False]
+    def build_options(self) -> list[bool]:
+        return [True, False]
 
 
 @dataclass
@@ -66,16 +142,14 @@ class DeclareFellowshipLocation(Request):
     location: Region
     progress: int
 
-    def __post_init__(self) -> None:
-        self.options: list[Region] = list(
-            self.location.reachable_regions(self.progress)
-        )
+    def build_options(self) -> list[Region]:
+        return list(self.location.reachable_regions(self.progress))
 
 
 @dataclass
 class EnterMordor(Request):
-    def __post_init__(self) -> None:
-        self.options: list[bool] = [True, False]
+    def build_options(self) -> list[bool]:
+        return [True, False]
 
 
 @dataclass
@@ -84,91 +158,97 @@ class HuntAllocation(Request):
     max_dice: int
     companions: int
 
-    def __post_init__(self) -> None:
+    def build_options(self) -> list[int]:
         max_allocation = min(self.companions, self.max_dice)
-        self.options: list[int] = list(range(self.min_allocation, max_allocation + 1))
+        return list(range(self.min_allocation, max_allocation + 1))
 
 
 @dataclass
 class PassTurn(Request):
-    def __post_init__(self) -> None:
-        self.options: list[bool] = [True, False]
+    def build_options(self) -> list[bool]:
+        return [True, False]
 
 
 @dataclass
 class ChooseDie(Request):
     dice: list[DieResult]
 
-    def __post_init__(self) -> None:
-        self.options: list[DieResult] = self.dice
+    def build_options(self) -> list[DieResult]:
+        return self.dice
 
 
 @dataclass
-class CharacterAction(Request):
+class CharacterAction(ActionRequest):
     side: Side
     fellowship: Fellowship
     regions: RegionMap
 
-    def __post_init__(self) -> None:
-        self.options: list[Action] = [Action.SKIP]
+    def action_mask(self) -> int:
+        mask = SKIP
 
-        friendly_armies_with_leadership = [
-            region.army
-            for region in self.regions.with_army_units(self.side)
-            if region.army is not None and region.army.leadership() > 0
-        ]
+        can_move, can_attack = self.can_leader_move_or_attack()
+        if can_move:
+            mask |= 1 << Action.LEADER_MOVE.value
 
-        if any(army.valid_moves() for army in friendly_armies_with_leadership):
-            self.options.append(Action.LEADER_MOVE)
-
-        if any(army.valid_attacks() for army in friendly_armies_with_leadership):
-            self.options.append(Action.LEADER_ATTACK)
+        if can_attack:
+            mask |= 1 << Action.LEADER_ATTACK.value
 
         if self.side == Side.FREE:
             if self.fellowship.revealed:
-                self.options.append(Action.HIDE_FELLOWSHIP)
+                mask |= 1 << Action.HIDE_FELLOWSHIP.value
             else:
-                self.options.append(Action.MOVE_FELLOWSHIP)
+                mask |= 1 << Action.MOVE_FELLOWSHIP.value
 
             if self.fellowship.companions:
-                self.options.append(Action.SEPARATE_COMPANIONS)
+                mask |= 1 << Action.SEPARATE_COMPANIONS.value
+
+            if self.regions.character_mask(Side.FREE):
+                mask |= 1 << Action.MOVE_COMPANIONS.value
+        elif self.can_move_minions():
+            mask |= 1 << Action.MOVE_MINIONS.value
+        return mask
+
+    @legality_check(Concern.ARMIES)
+    def can_leader_move_or_attack(self) -> tuple[bool, bool]:
+        return (
+            self.has_leadership(self.regions.move_mask(self.side)),
+            self.has_leadership(self.regions.attack_mask(self.side)),
+        )
 
-            if self.regions.with_characters(Side.FREE):
-                self.options.append(Action.MOVE_COMPANIONS)
+    def has_leadership(self, mask: int) -> bool:
+        return any(
+            region.army is not None and region.army.leadership() > 0
+            for region in self.regions.regions_in(mask)
+        )
 
-        else:
-            has_minions = len(self.regions.with_characters(Side.SHADOW)) > 0
-            has_nazgul = any(
-                region.army is not None and region.army.leaders() > 0
-                for region in self.regions.with_army_units(Side.SHADOW)
-            )
-            if has_minions or has_nazgul:
-                self.options.append(Action.MOVE_MINIONS)
+    @legality_check(Concern.ARMIES, Concern.CHARACTERS)
+    def can_move_minions(self) -> bool:
+        has_minions = self.regions.character_mask(Side.SHADOW) != 0
+        has_nazgul = any(
+            region.army is not None and region.army.leaders() > 0
+            for region in self.regions.with_army_units(Side.SHADOW)
+        )
+        return has_minions or has_nazgul
 
 
 @dataclass
-class ArmyAction(Request):
+class ArmyAction(ActionRequest):
     side: Side
     regions: RegionMap
 
-    def __post_init__(self) -> None:
-        self.options: list[Action] = [Action.SKIP]
-
-        friendly_armies = [
-            region.army
-            for region in self.regions.with_army_units(self.side)
-            if region.army is not None
-        ]
+    def action_mask(self) -> int:
+        mask = SKIP
 
-        if any(army.valid_moves() for army in friendly_armies):
-            self.options.append(Action.MOVE_ARMIES)
+        if self.regions.move_mask(self.side):
+            mask |= 1 << Action.MOVE_ARMIES.value
 
-        if any(army.valid_attacks() for army in friendly_armies):
-            self.options.append(Action.ATTACK)
+        if self.regions.attack_mask(self.side):
+            mask |= 1 << Action.ATTACK.value
+        return mask
 
 
 @dataclass
-class MusterAction(Request):
+class MusterAction(ActionRequest):
     side: Side
     regions: RegionMap
     politics: dict[Nation, PoliticalStatus]
@@ -176,33 +256,36 @@ class MusterAction(Request):
     characters_mustered: set[Character]
     fellowship: Fellowship
 
-    def __post_init__(self) -> None:
-        self.options: list[Action] = [Action.SKIP]
+    def action_mask(self) -> int:
+        mask = SKIP
 
         if self.can_politic():
-            self.options.append(Action.DIPLOMACY)
-
-        if self.can_muster()[0]:
-            self.options.append(Action.MUSTER_REGULAR_REGULAR)
-        if self.can_muster()[1]:
-            self.options.append(Action.MUSTER_ELITE)
-        if self.can_muster()[2]:
-            self.options.append(Action.MUSTER_LEADER_LEADER)
-        if self.can_muster()[0] and self.can_muster()[2]:
-            self.options.append(Action.MUSTER_REGULAR_LEADER)
+            mask |= 1 << Action.DIPLOMACY.value
+
+        regulars, elites, leaders = self.can_muster()
+        if regulars:
+            mask |= 1 << Action.MUSTER_REGULAR_REGULAR.value
+        if elites:
+            mask |= 1 << Action.MUSTER_ELITE.value
+        if leaders:
+            mask |= 1 << Action.MUSTER_LEADER_LEADER.value
+        if regulars and leaders:
+            mask |= 1 << Action.MUSTER_REGULAR_LEADER.value
 
         if self.can_muster_saruman():
-            self.options.append(Action.MUSTER_SARUMAN)
+            mask |= 1 << Action.MUSTER_SARUMAN.value
         if self.can_muster_witch_king():
-            self.options.append(Action.MUSTER_WITCH_KING)
+            mask |= 1 << Action.MUSTER_WITCH_KING.value
         if self.can_muster_mouth_of_sauron():
-            self.options.append(Action.MUSTER_MOUTH_OF_SAURON)
+            mask |= 1 << Action.MUSTER_MOUTH_OF_SAURON.value
+        return mask
 
     def can_politic(self) -> bool:
         return any(
             self.politics[nation].can_advance() for nation in NATION_SIDE[self.side]
         )
 
+    @legality_check(Concern.POLITICS, Concern.REINFORCEMENTS, Concern.ARMIES)
     def can_muster(self) -> tuple[bool, bool, bool]:
         regulars = 0
         elites = 0
@@ -225,14 +308,14 @@ class MusterAction(Request):
             return False
         return self.politics[Nation.ISENGARD].is_at_war()
 
+    @legality_check(Concern.POLITICS, Concern.ARMIES, Concern.CHARACTERS)
     def can_muster_witch_king(self) -> bool:
         if ALL_MINIONS[CharacterID.WITCH_KING] in self.characters_mustered:
             return False
         sauron_army = any(
             region.army
             for region in self.regions.with_army_units(Side.SHADOW)
-            if region.army is not None
-            and any(unit.nation == Nation.SAURON for unit in region.army.units)
+            if region.army is not None and region.army.has_nation(Nation.SAURON)
         )
         sauron_at_war = self.politics[Nation.SAURON].is_at_war()
         free_nation_at_war = any(
@@ -243,69 +326,71 @@ class MusterAction(Request):
         return sauron_army and sauron_at_war and free_nation_at_war
 
     def can_muster_mouth_of_sauron(self) -> bool:
+        return self.mouth_of_sauron_available() and (
+            self.fellowship.in_mordor()
+            or all(self.politics[nation].is_at_war() for nation in Nation)
+        )
+
+    @legality_check(Concern.ARMIES, Concern.CHARACTERS)
+    def mouth_of_sauron_available(self) -> bool:
         if ALL_MINIONS[CharacterID.MOUTH_OF_SAURON] in self.characters_mustered:
             return False
-        if all(
+        return not all(
             region.is_conquered for region in self.regions.with_nation(Nation.SAURON)
-        ):
-            return False
-        return self.fellowship.in_mordor() or all(
-            self.politics[nation].is_at_war() for nation in Nation
         )
 
 
 @dataclass
-class HybridAction(Request):
+class HybridAction(ActionRequest):
     army_action_request: ArmyAction
     muster_action_request: MusterAction
 
-    def __post_init__(self) -> None:
-        self.options: list[Action] = [Action.SKIP]
-        self.options.extend(self.army_action_request.options)
-        self.options.extend(self.muster_action_request.options)
+    def action_mask(self) -> int:
+        return (
+            self.army_action_request.action_mask()
+            | self.muster_action_request.action_mask()
+        )
 
 
 @dataclass
-class PalantirAction(Request):
+class PalantirAction(ActionRequest):
     player: PlayerState
 
-    def __post_init__(self) -> None:
-        self.options: list[Action] = [Action.SKIP]
+    def action_mask(self) -> int:
+        mask = SKIP
 
         if self.player.character_deck:
-            self.options.append(Action.DRAW_CHARACTER_EVENT)
+            mask |= 1 << Action.DRAW_CHARACTER_EVENT.value
         if self.player.strategy_deck:
-            self.options.append(Action.DRAW_STRATEGY_EVENT)
-        if any(card.category == CardCategory.CHARACTER for card in self.player.hand):
-            self.options.append(Action.PLAY_CHARACTER_EVENT)
-        if any(card.category == CardCategory.ARMY for card in self.player.hand):
-            self.options.append(Action.PLAY_ARMY_EVENT)
-        if any(card.category == CardCategory.MUSTER for card in self.player.hand):
-            self.options.append(Action.PLAY_MUSTER_EVENT)
+            mask |= 1 << Action.DRAW_STRATEGY_EVENT.value
+        for card in self.player.hand:
+            mask |= PLAY_EVENT[card.category]
+        return mask
 
 
 @dataclass
-class WillAction(Request):
+class WillAction(ActionRequest):
     characters_mustered: set[Character]
     companions: list[Companion]
-    regions: RegionMap
+    character_locations: dict[CharacterID, Region]
 
     character_action_request: CharacterAction
     hybrid_action_request: HybridAction
     palantir_action_request: PalantirAction
 
-    def __post_init__(self) -> None:
-        self.options: list[Action] = [Action.SKIP]
-
-        self.options.extend(self.character_action_request.options)
-        self.options.extend(self.hybrid_action_request.options)
-        self.options.extend(self.palantir_action_request.options)
+    def action_mask(self) -> int:
+        mask = (
+            self.character_action_request.action_mask()
+            | self.hybrid_action_request.action_mask()
+            | self.palantir_action_request.action_mask()
+        )
 
         if self.can_muster_gandalf():
-            self.options.append(Action.MUSTER_GANDALF)
+            mask |= 1 << Action.MUSTER_GANDALF.value
 
         if self.can_muster_aragorn():
-            self.options.append(Action.MUSTER_ARAGORN)
+            mask |= 1 << Action.MUSTER_ARAGORN.value
+        return mask
 
     def can_muster_gandalf(self) -> bool:
         gandalf = ALL_COMPANIONS[CharacterID.GANDALF_GREY]
@@ -318,15 +403,10 @@ class WillAction(Request):
         )
 
     def can_muster_aragorn(self) -> bool:
-        aragorn_regions = {
-            self.regions.with_name("Dol Amroth"),
-            self.regions.with_name("Pelargir"),
-            self.regions.with_name("Minas Tirith"),
-        }
-        return any(
-            region.army.has_character(CharacterID.STRIDER)
-            for region in aragorn_regions
-            if region.army
+        strider_location = self.character_locations.get(CharacterID.STRIDER)
+        return (
+            strider_location is not None
+            and strider_location.name in ARAGORN_MUSTER_REGIONS
         )
 
 
@@ -334,30 +414,24 @@ class WillAction(Request):
 class PlayCharacterEvent(Request):
     hand: list[Card]
 
-    def __post_init__(self) -> None:
-        self.options: list[Card] = [
-            card for card in self.hand if card.category == CardCategory.CHARACTER
-        ]
+    def build_options(self) -> list[Card]:
+        return [card for card in self.hand if card.category == CardCategory.CHARACTER]
 
 
 @dataclass
 class PlayArmyEvent(Request):
     hand: list[Card]
 
-    def __post_init__(self) -> None:
-        self.options: list[Card] = [
-            card for card in self.hand if card.category == CardCategory.ARMY
-        ]
+    def build_options(self) -> list[Card]:
+        return [card for card in self.hand if card.category == CardCategory.ARMY]
 
 
 @dataclass
 class PlayMusterEvent(Request):
     hand: list[Card]
 
-    def __post_init__(self) -> None:
-        self.options: list[Card] = [
-            card for card in self.hand if card.category == CardCategory.MUSTER
-        ]
+    def build_options(self) -> list[Card]:
+        return [card for card in self.hand if card.category == CardCategory.MUSTER]
 
 
 @dataclass
@@ -365,8 +439,8 @@ class Diplomacy(Request):
     side: Side
     politics: dict[Nation, PoliticalStatus]
 
-    def __post_init__(self) -> None:
-        self.options: list[Nation] = [
+    def build_options(self) -> list[Nation]:
+        return [
             nation
             for nation in NATION_SIDE[self.side]
             if self.politics[nation].can_advance()
@@ -377,25 +451,21 @@ class Diplomacy(Request):
 class MusterWitchKingArmy(Request):
     regions: RegionMap
 
-    def __post_init__(self) -> None:
+    def build_options(self) -> list[Army]:
         shadow_armies = [
             region.army
             for region in self.regions.with_army_units(Side.SHADOW)
             if region.army is not None
         ]
-        self.options: list[Army] = [
-            army
-            for army in shadow_armies
-            if any(unit.nation == Nation.SAURON for unit in army.units)
-        ]
+        return [army for army in shadow_armies if army.has_nation(Nation.SAURON)]
 
 
 @dataclass
 class MusterMouthRegion(Request):
     regions: RegionMap
 
-    def __post_init__(self) -> None:
-        self.options: list[Region] = [
+    def build_options(self) -> list[Region]:
+        return [
             region
             for region in self.regions.with_nation(Nation.SAURON)
             if region.settlement == Settlement.STRONGHOLD and not region.is_conquered
@@ -406,24 +476,26 @@ class MusterMouthRegion(Request):
 class MusterGandalfWhiteRegion(Request):
     regions: RegionMap
 
-    def __post_init__(self) -> None:
-        self.options: list[Region] = [
+    def build_options(self) -> list[Region]:
+        options: list[Region] = [
             region
             for region in self.regions.with_nation(Nation.ELVES)
             if region.settlement == Settlement.STRONGHOLD and not region.is_conquered
         ]
-        self.options.append(self.regions.with_name("Fangorn"))
+        options.append(self.regions.with_name("Fangorn"))
+        return options
 
 
 @dataclass
 class CasualtyStrategy(Request):
     guide: Companion
 
-    def __post_init__(self) -> None:
-        self.options: list[Casualty] = [Casualty.NONE]
+    def build_options(self) -> list[Casualty]:
+        options: list[Casualty] = [Casualty.NONE]
         if self.guide.name != CharacterID.GOLLUM:
-            self.options.append(Casualty.GUIDE)
-            self.options.append(Casualty.RANDOM)
+            options.append(Casualty.GUIDE)
+            options.append(Casualty.RANDOM)
+        return options
 
 
 @dataclass
@@ -434,7 +506,7 @@ class MusterLocation(Request):
     regions: RegionMap
     exclude: Optional[Region] = None
 
-    def __post_init__(self) -> None:
+    def build_options(self) -> list[Region]:
         nations_at_war = [
             nation
             for nation, disposition in self.politics.items()
@@ -451,7 +523,7 @@ class MusterLocation(Request):
             }
         if self.exclude is not None:
             settlements.remove(self.exclude)
-        self.options: list[Region] = list(settlements)
+        return list(settlements)
 
 
 @dataclass
@@ -460,12 +532,11 @@ class MoveArmy(Request):
     regions: RegionMap
     leader_required: bool
 
-    def __post_init__(self) -> None:
-        self.options: list[Army] = [
+    def build_options(self) -> list[Army]:
+        return [
             region.army
-            for region in self.regions.with_army_units(self.side)
+            for region in self.regions.regions_in(self.regions.move_mask(self.side))
             if region.army is not None
-            and len(region.army.valid_moves()) > 0
             and (region.army.leaders() > 0 or not self.leader_required)
         ]
 
@@ -474,8 +545,85 @@ class MoveArmy(Request):
 class MoveArmyDestination(Request):
     army: Army
 
-    def __post_init__(self) -> None:
-        self.options: list[Region] = self.army.valid_moves()
+    def build_options(self) -> list[Region]:
+        return self.army.valid_moves()
+
+
+class UnitSelections(Sequence[list[ArmyUnit]]):
+    # Every way to choose some, but not all, of an army's units, as a count of units
+    # from each stack of identical units. Selections are numbered in mixed radix over
+    # the stacks and only built when accessed. Leader stacks are the most significant
+    # digits, so the selections without a leader are exactly the lowest numbers, and
+    # the valid selections are always a contiguous range.
+    def __init__(
+        self, stacks: list[tuple[ArmyUnit, int]], leader_required: bool
+    ) -> None:
+        self.stacks = sorted(stacks, key=lambda stack: stack[0].type == UnitType.LEADER)
+        total, without_leaders = 1, 1
+        for unit, count in self.stacks:
+            total *= count + 1
+            if unit.type != UnitType.LEADER:
+                without_leaders *= count + 1
+        # The empty selection is 0, and the whole army is the last selection
+        self.start = without_leaders if leader_required else 1
+        self.stop = max(self.start, total - 1)
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def counts(self, index: int) -> list[int]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Unit selection {index} is out of range.")
+        number = self.start + index
+        counts = []
+        for _, count in self.stacks:
+            number, selected = divmod(number, count + 1)
+            counts.append(selected)
+        return counts
+
+    def selection(self, counts: Sequence[int]) -> list[ArmyUnit]:
+        return [
+            unit
+            for (unit, _), selected in zip(self.stacks, counts)
+            for _ in range(selected)
+        ]
+
+    @overload
+    def __getitem__(self, index: int) -> list[ArmyUnit]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[list[ArmyUnit]]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> list[ArmyUnit] | list[list[ArmyUnit]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        return self.selection(self.counts(index))
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        number, radix, matched = 0, 1, 0
+        for unit, count in self.stacks:
+            selected = value.count(unit)
+            if selected > count:
+                raise ValueError(f"{value} selects too many {unit}.")
+            number += selected * radix
+            radix *= count + 1
+            matched += selected
+        index = number - self.start
+        stop = len(self) if stop is None else min(stop, len(self))
+        if matched != len(value) or not start <= index < stop:
+            raise ValueError(f"{value} is not a valid selection of these units.")
+        return index
+
+    def __contains__(self, value: object) -> bool:
+        try:
+            self.index(value)
+        except (ValueError, AttributeError, TypeError):
+            return False
+        return True
 
 
 @dataclass
@@ -483,12 +631,6 @@ class MoveArmyUnits(Request):
     army: Army
     leader_required: bool
 
-    def __post_init__(self) -> None:
+    def build_options(self) -> UnitSelections:
         # TODO This doesn't let you move characters with the army
-        self.options: list[list[ArmyUnit]] = [
-            list(combination)
-            for i in range(1, len(self.army.units))
-            for combination in combinations(self.army.units, i)
-            if not self.leader_required
-            or any(unit.type == UnitType.LEADER for unit in combination)
-        ]
+        return UnitSelections(self.army.unit_stacks(), self.leader_required)
@@ -1,13 +1,16 @@
-import csv
-import random
 from collections import Counter, deque
-from copy import deepcopy
+from copy import copy
 from dataclasses import dataclass, field
-from typing import Optional
+from enum import IntEnum
+from functools import cache
+from types import MappingProxyType
+from typing import Any, Callable, Hashable, Iterable, Mapping, Optional, TypeVar, cast
 
 from war_of_the_ring_ai.agent import Agent, random_strategy
+from war_of_the_ring_ai.assets import load_assets
 from war_of_the_ring_ai.game_objects import (
     NATION_SIDE,
+    UNIT_SLOTS,
     Army,
     ArmyUnit,
     Card,
@@ -25,12 +28,16 @@ from war_of_the_ring_ai.game_objects import (
     PoliticalStatus,
     Region,
     RegionMap,
-    Settlement,
     Side,
     UnitType,
+    army_unit,
 )
+from war_of_the_ring_ai.game_random import GameRandom
+from war_of_the_ring_ai.zobrist import HashFeature, zobrist_key
 
-INITIAL_COMPANION_IDS = [
+# Setup data is shared by every game in the process, possibly across threads, so it is
+# immutable. Games build their own mutable copies from it.
+INITIAL_COMPANION_IDS = (
     CharacterID.GANDALF_GREY,
     CharacterID.STRIDER,
     CharacterID.GIMLI,
@@ -38,23 +45,26 @@ INITIAL_COMPANION_IDS = [
     CharacterID.BOROMIR,
     CharacterID.MERRY,
     CharacterID.PIPPIN,
-]
+)
 
 INITIAL_GUIDE_ID = CharacterID.GANDALF_GREY
 INITIAL_FELLOWSHIP_LOCATION = "Rivendell"
 
 INITIAL_REINFORCEMENTS = {
-    Nation.DWARVES: [2, 3, 3],
-    Nation.ELVES: [2, 4, 0],
-    Nation.GONDOR: [6, 4, 3],
-    Nation.NORTH: [6, 4, 3],
-    Nation.ROHAN: [6, 4, 3],
-    Nation.ISENGARD: [6, 5, 0],
-    Nation.SAURON: [8, 4, 4],
-    Nation.SOUTHRON: [10, 3, 0],
+    Nation.DWARVES: (2, 3, 3),
+    Nation.ELVES: (2, 4, 0),
+    Nation.GONDOR: (6, 4, 3),
+    Nation.NORTH: (6, 4, 3),
+    Nation.ROHAN: (6, 4, 3),
+    Nation.ISENGARD: (6, 5, 0),
+    Nation.SAURON: (8, 4, 4),
+    Nation.SOUTHRON: (10, 3, 0),
 }
 
-INITIAL_HUNT_TILES = [
+CHARACTER_DECK = frozenset({CardCategory.CHARACTER})
+STRATEGY_DECK = frozenset({CardCategory.ARMY, CardCategory.MUSTER})
+
+INITIAL_HUNT_TILES = (
     HuntTile(3, False, None),
     HuntTile(3, False, None),
     HuntTile(3, False, None),
@@ -71,26 +81,30 @@ INITIAL_HUNT_TILES = [
     HuntTile(100, True, None),
     HuntTile(100, True, None),
     HuntTile(100, True, None),
-]
-
-ALL_COMPANIONS = {
-    CharacterID.GANDALF_GREY: Companion(CharacterID.GANDALF_GREY, 3, 1),
-    CharacterID.STRIDER: Companion(CharacterID.STRIDER, 3, 1),
-    CharacterID.GIMLI: Companion(CharacterID.GIMLI, 2, 1),
-    CharacterID.LEGOLAS: Companion(CharacterID.LEGOLAS, 2, 1),
-    CharacterID.BOROMIR: Companion(CharacterID.BOROMIR, 2, 1),
-    CharacterID.MERRY: Companion(CharacterID.MERRY, 1, 1),
-    CharacterID.PIPPIN: Companion(CharacterID.PIPPIN, 1, 1),
-    CharacterID.GANDALF_WHITE: Companion(CharacterID.GANDALF_WHITE, 3, 1),
-    CharacterID.ARAGORN: Companion(CharacterID.ARAGORN, 3, 2),
-    CharacterID.GOLLUM: Companion(CharacterID.GOLLUM, 0, 0),
-}
+)
 
-ALL_MINIONS = {
-    CharacterID.SARUMAN: Minion(CharacterID.SARUMAN, 0, 1),
-    CharacterID.WITCH_KING: Minion(CharacterID.WITCH_KING, -1, 2),
-    CharacterID.MOUTH_OF_SAURON: Minion(CharacterID.MOUTH_OF_SAURON, 3, 2),
-}
+ALL_COMPANIONS: Mapping[CharacterID, Companion] = MappingProxyType(
+    {
+        CharacterID.GANDALF_GREY: Companion(CharacterID.GANDALF_GREY, 3, 1),
+        CharacterID.STRIDER: Companion(CharacterID.STRIDER, 3, 1),
+        CharacterID.GIMLI: Companion(CharacterID.GIMLI, 2, 1),
+        CharacterID.LEGOLAS: Companion(CharacterID.LEGOLAS, 2, 1),
+        CharacterID.BOROMIR: Companion(CharacterID.BOROMIR, 2, 1),
+        CharacterID.MERRY: Companion(CharacterID.MERRY, 1, 1),
+        CharacterID.PIPPIN: Companion(CharacterID.PIPPIN, 1, 1),
+        CharacterID.GANDALF_WHITE: Companion(CharacterID.GANDALF_WHITE, 3, 1),
+        CharacterID.ARAGORN: Companion(CharacterID.ARAGORN, 3, 2),
+        CharacterID.GOLLUM: Companion(CharacterID.GOLLUM, 0, 0),
+    }
+)
+
+ALL_MINIONS: Mapping[CharacterID, Minion] = MappingProxyType(
+    {
+        CharacterID.SARUMAN: Minion(CharacterID.SARUMAN, 0, 1),
+        CharacterID.WITCH_KING: Minion(CharacterID.WITCH_KING, -1, 2),
+        CharacterID.MOUTH_OF_SAURON: Minion(CharacterID.MOUTH_OF_SAURON, 3, 2),
+    }
+)
 
 
 def init_fellowship() -> Fellowship:
@@ -102,56 +116,50 @@ def init_fellowship() -> Fellowship:
     return Fellowship(initial_companions, guide)
 
 
+@cache
+def load_region_map() -> RegionMap:
+    # This map is a template holding the starting position, and must not be modified.
+    assets = load_assets()
+    regions: RegionMap = RegionMap()
+    for data in assets.regions:
+        region = Region(data.name, [], data.nation, data.settlement, army=None)
+        region.army = init_army(
+            data.regulars, data.elites, data.leaders, data.nation, region
+        )
+        regions.insert(region)
+    for data, region in zip(assets.regions, regions.regions):
+        region.neighbors = [regions.regions[neighbor] for neighbor in data.neighbors]
+    regions.build_tables(list(assets.distances))
+    return regions
+
+
 def init_politics() -> dict[Nation, PoliticalStatus]:
-    politics = {}
-    with open("data/politics.csv", newline="", encoding="utf8") as csvfile:
-        reader = csv.reader(csvfile, delimiter="|")
-        for nation, disposition, active in reader:
-            politics[Nation[nation]] = PoliticalStatus(
-                int(disposition), active == "active"
-            )
-    return politics
+    return {
+        nation: PoliticalStatus(disposition, active)
+        for nation, disposition, active in load_assets().politics
+    }
 
 
-def init_deck(side: Side, categories: set[CardCategory]) -> deque[Card]:
+def init_deck(side: Side, categories: frozenset[CardCategory]) -> deque[Card]:
     deck: deque[Card] = deque()
-    with open("data/cards.csv", newline="", encoding="utf8") as csvfile:
-        reader = csv.reader(csvfile, delimiter="|")
-        for event, combat, side_str, category_str in reader:
-            if Side[side_str] == side and CardCategory[category_str] in categories:
-                card = Card(event, combat, Side[side_str], CardCategory[category_str])
-                deck.append(card)
-    random.shuffle(deck)
+    fill_deck(deck, side, categories)
     return deck
 
 
+def fill_deck(
+    deck: deque[Card], side: Side, categories: frozenset[CardCategory]
+) -> None:
+    # Decks are filled in card list order, and shuffled once the game's RNG is known
+    deck.clear()
+    deck.extend(
+        card
+        for card in load_assets().cards
+        if card.side == side and card.category in categories
+    )
+
+
 def init_region_map() -> RegionMap:
-    regions: RegionMap = RegionMap()
-    neighbors: dict[str, list[str]] = {}
-    with open("data/worldmap.csv", newline="", encoding="utf8") as csvfile:
-        reader = csv.reader(csvfile, delimiter="|")
-        for (
-            name,
-            neighbor_str,
-            nation_str,
-            settlement_str,
-            regulars_str,
-            elites_str,
-            leaders_str,
-        ) in reader:
-            nation = None if nation_str == "None" else Nation[nation_str.upper()]
-            settlement = (
-                None if settlement_str == "None" else Settlement[settlement_str.upper()]
-            )
-            region = Region(name, [], nation, settlement, army=None)
-            region.army = init_army(
-                int(regulars_str), int(elites_str), int(leaders_str), nation, region
-            )
-            neighbors[name] = neighbor_str.split(",")
-            regions.insert(region)
-    for name, region in regions.regions_by_name.items():
-        region.neighbors = [regions.with_name(neighbor) for neighbor in neighbors[name]]
-    return regions
+    return load_region_map().clone()
 
 
 def init_army(
@@ -164,26 +172,27 @@ def init_army(
         army = Army(
             Side.FREE if nation in NATION_SIDE[Side.FREE] else Side.SHADOW, region
         )
-        for _ in range(regulars):
-            army.units.append(ArmyUnit(UnitType.REGULAR, nation))
-        for _ in range(elites):
-            army.units.append(ArmyUnit(UnitType.ELITE, nation))
-        for _ in range(leaders):
-            army.units.append(ArmyUnit(UnitType.LEADER, nation))
+        army.add(army_unit(UnitType.REGULAR, nation), regulars)
+        army.add(army_unit(UnitType.ELITE, nation), elites)
+        army.add(army_unit(UnitType.LEADER, nation), leaders)
     return army
 
 
+def init_hunt_pool() -> HuntPool:
+    return HuntPool(list(INITIAL_HUNT_TILES))
+
+
 def init_player(side: Side) -> "PlayerState":
     return PlayerState(
         Agent(side.name, random_strategy),
         side,
-        init_deck(side, {CardCategory.CHARACTER}),
-        init_deck(side, {CardCategory.ARMY, CardCategory.MUSTER}),
+        init_deck(side, CHARACTER_DECK),
+        init_deck(side, STRATEGY_DECK),
         4 if side == Side.FREE else 7,
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerState:  # pylint: disable=too-many-instance-attributes
     agent: Agent
     side: Side
@@ -199,12 +208,76 @@ class PlayerState:  # pylint: disable=too-many-instance-attributes
         # TODO This can be player.dice.total() when mypy supports python 3.10
         return sum(self.dice.values())
 
+    def clone(self) -> "PlayerState":
+        # The agent is copied too, so its decision count and random stream are the
+        # clone's own. GameState.clone binds it to the clone's agent stream.
+        return PlayerState(
+            copy(self.agent),
+            self.side,
+            self.character_deck.copy(),
+            self.strategy_deck.copy(),
+            self.max_dice,
+            self.dice.copy(),
+            list(self.hand),
+            self.victory_points,
+        )
+
+    def reset(self) -> None:
+        fill_deck(self.character_deck, self.side, CHARACTER_DECK)
+        fill_deck(self.strategy_deck, self.side, STRATEGY_DECK)
+        self.dice.clear()
+        self.hand.clear()
+        self.victory_points = 0
+
+
+class Concern(IntEnum):
+    # Parts of the state that legality checks depend on, each versioned separately.
+    # Concerns index their version counters directly.
+    POLITICS = 0
+    REINFORCEMENTS = 1
+    ARMIES = 2  # Army units and conquered settlements
+    CHARACTERS = 3  # Character locations, mustered characters and companions
+
+
+ALL_CONCERNS = tuple(Concern)
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class LegalityCache:
+    # A modification counter for each concern, and the results of legality checks at
+    # the counters they were computed at. Counters only ever increase, even on undo,
+    # so a result is valid for as long as the counters of its concerns are unchanged.
+    versions: list[int] = field(default_factory=lambda: [0] * len(Concern))
+    results: dict[Hashable, tuple[tuple[int, ...], Any]] = field(default_factory=dict)
+
+    def touch(self, *concerns: Concern) -> None:
+        for concern in concerns or ALL_CONCERNS:
+            self.versions[concern] += 1
+
+    def memoize(
+        self, key: Hashable, concerns: tuple[Concern, ...], check: Callable[[], T]
+    ) -> T:
+        versions = tuple(map(self.versions.__getitem__, concerns))
+        cached = self.results.get(key)
+        if cached is not None and cached[0] == versions:
+            return cast(T, cached[1])
+        result = check()
+        self.results[key] = versions, result
+        return result
+
+    def clone(self) -> "LegalityCache":
+        return LegalityCache(list(self.versions), dict(self.results))
+
 
 @dataclass
 class GameState:  # pylint: disable=too-many-instance-attributes
     regions: RegionMap = field(default_factory=init_region_map)
     reinforcements: dict[Nation, list[int]] = field(
-        default_factory=lambda: deepcopy(INITIAL_REINFORCEMENTS)
+        default_factory=lambda: {
+            nation: list(counts) for nation, counts in INITIAL_REINFORCEMENTS.items()
+        }
     )
 
     fellowship: Fellowship = field(default_factory=init_fellowship)
@@ -217,10 +290,392 @@ class GameState:  # pylint: disable=too-many-instance-attributes
 
     hunt_box_eyes: int = 0
     hunt_box_character: int = 0
-    hunt_pool: HuntPool = field(default_factory=lambda: HuntPool(INITIAL_HUNT_TILES))
+    hunt_pool: HuntPool = field(default_factory=init_hunt_pool)
 
     characters_mustered: set[Character] = field(default_factory=set)
+    character_locations: dict[CharacterID, Region] = field(default_factory=dict)
+
+    rng: GameRandom = field(default_factory=GameRandom, repr=False, compare=False)
+
+    # Reversible record of every mutation made since the oldest open checkpoint. Nothing
+    # is recorded while there are no open checkpoints.
+    undo_log: list[Callable[[], None]] = field(
+        default_factory=list, repr=False, compare=False
+    )
+    undo_marks: list[tuple[int, int]] = field(
+        default_factory=list, repr=False, compare=False
+    )
+
+    # Zobrist hash of the position, kept up to date by the mutators below
+    zobrist: int = field(default=0, repr=False, compare=False)
+
+    # Versions of the state for memoized legality checks, touched by the mutators below
+    legality: LegalityCache = field(
+        default_factory=LegalityCache, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         self.fellowship.location = self.regions.with_name(INITIAL_FELLOWSHIP_LOCATION)
         self.players = self.free_player, self.shadow_player
+        for player in self.players:
+            player.agent.rng = self.rng.agents
+        self._shuffle()
+        self.locate_characters()
+        self.zobrist = self.compute_zobrist()
+
+    def _shuffle(self) -> None:
+        for player in self.players:
+            self.rng.decks.shuffle(player.character_deck)
+            self.rng.decks.shuffle(player.strategy_deck)
+        self.rng.hunt.shuffle(self.hunt_pool.tiles)
+
+    def locate_characters(self) -> None:
+        self.character_locations.clear()
+        for region in self.regions.with_characters():
+            assert region.army
+            for character in region.army.characters:
+                self.character_locations[character.name] = region
+
+    def reset(self, seed: Optional[int] = None, game: int = 0) -> None:
+        # Restores the starting setup in place, without reallocating the map. With a
+        # seed, the random streams are reseeded and the result matches a new state
+        # created with GameRandom(seed, game). Otherwise the current streams continue.
+        if seed is not None:
+            self.rng.reseed(seed, game)
+        self.regions.reset(load_region_map())
+        for nation, counts in INITIAL_REINFORCEMENTS.items():
+            self.reinforcements[nation][:] = counts
+
+        fellowship = self.fellowship
+        fellowship.companions[:] = [ALL_COMPANIONS[c] for c in INITIAL_COMPANION_IDS]
+        fellowship.guide = ALL_COMPANIONS[INITIAL_GUIDE_ID]
+        fellowship.location = self.regions.with_name(INITIAL_FELLOWSHIP_LOCATION)
+        fellowship.revealed = False
+        fellowship.progress = 0
+        fellowship.corruption = 0
+
+        rings = ElvenRings()
+        self.elven_rings.free, self.elven_rings.shadow = rings.free, rings.shadow
+        for nation, disposition, active in load_assets().politics:
+            self.politics[nation].disposition = disposition
+            self.politics[nation].active = active
+
+        for player in self.players:
+            player.reset()
+
+        self.hunt_box_eyes = 0
+        self.hunt_box_character = 0
+        self.hunt_pool.tiles[:] = INITIAL_HUNT_TILES
+        self.hunt_pool.reserve.clear()
+        self._shuffle()
+
+        self.characters_mustered.clear()
+        self.locate_characters()
+        self.undo_log.clear()
+        self.undo_marks.clear()
+        self.zobrist = self.compute_zobrist()
+        self.legality.touch()
+
+    def compute_zobrist(self) -> int:
+        zobrist = 0
+        for region in self.regions.regions:
+            if region.army is not None:
+                zobrist ^= self._units_hash(region, range(UNIT_SLOTS))
+                for character in region.army.characters:
+                    zobrist ^= zobrist_key(
+                        HashFeature.CHARACTER, character.name.value, region.id
+                    )
+            if region.is_conquered:
+                zobrist ^= zobrist_key(HashFeature.CONQUERED, region.id)
+        zobrist ^= self._location_hash(self.fellowship.location)
+        zobrist ^= zobrist_key(
+            HashFeature.FELLOWSHIP_PROGRESS, self.fellowship.progress
+        )
+        zobrist ^= zobrist_key(
+            HashFeature.FELLOWSHIP_CORRUPTION, self.fellowship.corruption
+        )
+        zobrist ^= zobrist_key(
+            HashFeature.FELLOWSHIP_REVEALED, self.fellowship.revealed
+        )
+        for nation, status in self.politics.items():
+            zobrist ^= self._politics_hash(nation, status)
+        for player in self.players:
+            zobrist ^= self._dice_hash(player, player.dice)
+        zobrist ^= zobrist_key(HashFeature.HUNT_BOX_EYES, self.hunt_box_eyes)
+        zobrist ^= zobrist_key(HashFeature.HUNT_BOX_CHARACTER, self.hunt_box_character)
+        return zobrist
+
+    @staticmethod
+    def _units_hash(region: Region, slots: Iterable[int]) -> int:
+        zobrist = 0
+        if region.army is not None:
+            for slot in slots:
+                if count := region.army.unit_counts[slot]:
+                    zobrist ^= zobrist_key(HashFeature.UNITS, region.id, slot, count)
+        return zobrist
+
+    @staticmethod
+    def _location_hash(location: Optional[Region]) -> int:
+        return zobrist_key(
+            HashFeature.FELLOWSHIP_LOCATION, -1 if location is None else location.id
+        )
+
+    @staticmethod
+    def _politics_hash(nation: Nation, status: PoliticalStatus) -> int:
+        return zobrist_key(
+            HashFeature.POLITICS, nation.value, status.disposition, status.active
+        )
+
+    @staticmethod
+    def _dice_hash(player: PlayerState, dice: Mapping[DieResult, int]) -> int:
+        zobrist = 0
+        for die, count in dice.items():
+            if count:
+                zobrist ^= zobrist_key(
+                    HashFeature.DICE, player.side.value, die.value, count
+                )
+        return zobrist
+
+    def clone(self) -> "GameState":
+        # Copies only what can change during a game. Map topology, cards, hunt tiles
+        # and characters are immutable during play and are shared.
+        state = copy(self)
+        state.regions = self.regions.clone()
+        regions = state.regions.regions
+        state.reinforcements = {
+            nation: list(counts) for nation, counts in self.reinforcements.items()
+        }
+        state.fellowship = self.fellowship.clone(
+            None
+            if self.fellowship.location is None
+            else regions[self.fellowship.location.id]
+        )
+        state.elven_rings = ElvenRings(self.elven_rings.free, self.elven_rings.shadow)
+        state.politics = {
+            nation: PoliticalStatus(status.disposition, status.active)
+            for nation, status in self.politics.items()
+        }
+        state.free_player = self.free_player.clone()
+        state.shadow_player = self.shadow_player.clone()
+        state.players = state.free_player, state.shadow_player
+        state.hunt_pool = self.hunt_pool.clone()
+        state.characters_mustered = set(self.characters_mustered)
+        state.character_locations = {
+            character: regions[region.id]
+            for character, region in self.character_locations.items()
+        }
+        state.rng = self.rng.clone()
+        for player in state.players:
+            player.agent.rng = state.rng.agents
+        state.legality = self.legality.clone()
+        state.undo_log = []
+        state.undo_marks = []
+        return state
+
+    def checkpoint(self) -> None:
+        self.undo_marks.append((len(self.undo_log), self.zobrist))
+
+    def undo(self) -> None:
+        # Restores the state as it was when the most recent checkpoint was made
+        mark, zobrist = self.undo_marks.pop()
+        while len(self.undo_log) > mark:
+            self.undo_log.pop()()
+        self.zobrist = zobrist
+
+    def _record(self, undo: Callable[[], None]) -> None:
+        if self.undo_marks:
+            self.undo_log.append(undo)
+
+    def _touch(self, *concerns: Concern) -> None:
+        self.legality.touch(*concerns)
+        # Undoing a change is a change too, so undo touches the concerns again
+        self._record(lambda: self.legality.touch(*concerns))
+
+    def _assign(self, obj: Any, name: str, value: Any) -> None:
+        if self.undo_marks:
+            previous = getattr(obj, name)
+            self.undo_log.append(lambda: setattr(obj, name, previous))
+        setattr(obj, name, value)
+
+    def add_units(self, region: Region, side: Side, units: list[ArmyUnit]) -> None:
+        previous_army = region.army
+        slots = {unit.slot for unit in units}
+        self.zobrist ^= self._units_hash(region, slots)
+        self.regions.add_units(region, side, units)
+        self._touch(Concern.ARMIES)
+        self.zobrist ^= self._units_hash(region, slots)
+        self._record(lambda: self._restore_army(region, previous_army, units))
+
+    def _restore_army(
+        self, region: Region, army: Optional[Army], units: list[ArmyUnit]
+    ) -> None:
+        self.regions.remove_units(region, units)
+        region.army = army
+        self.regions.update_indexes(region)
+
+    def remove_units(self, region: Region, units: list[ArmyUnit]) -> None:
+        assert region.army
+        side = region.army.side
+        slots = {unit.slot for unit in units}
+        self.zobrist ^= self._units_hash(region, slots)
+        self.regions.remove_units(region, units)
+        self._touch(Concern.ARMIES)
+        self.zobrist ^= self._units_hash(region, slots)
+        self._record(lambda: self.regions.add_units(region, side, units))
+
+    def character_location(self, character: CharacterID) -> Optional[Region]:
+        return self.character_locations.get(character)
+
+    def has_character(self, character: CharacterID) -> bool:
+        return character in self.character_locations
+
+    def add_character(self, region: Region, side: Side, character: Character) -> None:
+        previous_army = region.army
+        self.regions.add_character(region, side, character)
+        self._touch(Concern.ARMIES, Concern.CHARACTERS)
+        self.zobrist ^= zobrist_key(
+            HashFeature.CHARACTER, character.name.value, region.id
+        )
+        self.character_locations[character.name] = region
+        self._record(lambda: self._restore_character(region, previous_army, character))
+
+    def _restore_character(
+        self, region: Region, army: Optional[Army], character: Character
+    ) -> None:
+        self.regions.remove_character(region, character)
+        del self.character_locations[character.name]
+        region.army = army
+        self.regions.update_indexes(region)
+
+    def remove_character(self, character: Character) -> Region:
+        region = self.character_locations.pop(character.name)
+        assert region.army
+        army = region.army
+        index = army.characters.index(character)
+        self.regions.remove_character(region, character)
+        self._touch(Concern.ARMIES, Concern.CHARACTERS)
+        self.zobrist ^= zobrist_key(
+            HashFeature.CHARACTER, character.name.value, region.id
+        )
+        self._record(lambda: self._return_character(army, index, character))
+        return region
+
+    def _return_character(self, army: Army, index: int, character: Character) -> None:
+        army.characters.insert(index, character)
+        self.character_locations[character.name] = army.region
+        self.regions.update_indexes(army.region)
+
+    def add_mustered(self, character: Character) -> None:
+        self.characters_mustered.add(character)
+        self._touch(Concern.CHARACTERS)
+        self._record(lambda: self.characters_mustered.remove(character))
+
+    def set_reinforcements(
+        self, nation: Nation, unit_type: UnitType, count: int
+    ) -> None:
+        counts = self.reinforcements[nation]
+        previous = counts[unit_type.value]
+        counts[unit_type.value] = count
+        self._touch(Concern.REINFORCEMENTS)
+        self._record(lambda: counts.__setitem__(unit_type.value, previous))
+
+    def set_disposition(self, nation: Nation, disposition: int) -> None:
+        status = self.politics[nation]
+        self.zobrist ^= self._politics_hash(nation, status)
+        self._assign(status, "disposition", disposition)
+        self._touch(Concern.POLITICS)
+        self.zobrist ^= self._politics_hash(nation, status)
+
+    def set_conquered(self, region: Region, conquered: bool) -> None:
+        if region.is_conquered != conquered:
+            self.zobrist ^= zobrist_key(HashFeature.CONQUERED, region.id)
+            self.regions.set_conquered(region, conquered)
+            self._touch(Concern.ARMIES)
+            self._record(lambda: self.regions.set_conquered(region, not conquered))
+
+    def draw_card(self, player: PlayerState, deck: deque[Card]) -> Card:
+        card = deck.pop()
+        player.hand.append(card)
+        self._record(lambda: deck.append(player.hand.pop()))
+        return card
+
+    def discard(self, player: PlayerState, card: Card) -> None:
+        index = player.hand.index(card)
+        del player.hand[index]
+        self._record(lambda: player.hand.insert(index, card))
+
+    def set_dice(self, player: PlayerState, dice: Counter[DieResult]) -> None:
+        self.zobrist ^= self._dice_hash(player, player.dice)
+        self._assign(player, "dice", dice)
+        self.zobrist ^= self._dice_hash(player, player.dice)
+
+    def set_die_count(self, player: PlayerState, die: DieResult, count: int) -> None:
+        previous = player.dice[die]
+        self.zobrist ^= self._dice_hash(player, {die: previous})
+        player.dice[die] = count
+        self.zobrist ^= self._dice_hash(player, {die: count})
+        self._record(lambda: player.dice.__setitem__(die, previous))
+
+    def set_hunt_box_eyes(self, eyes: int) -> None:
+        self.zobrist ^= zobrist_key(HashFeature.HUNT_BOX_EYES, self.hunt_box_eyes)
+        self.zobrist ^= zobrist_key(HashFeature.HUNT_BOX_EYES, eyes)
+        self._assign(self, "hunt_box_eyes", eyes)
+
+    def set_hunt_box_character(self, character: int) -> None:
+        self.zobrist ^= zobrist_key(
+            HashFeature.HUNT_BOX_CHARACTER, self.hunt_box_character
+        )
+        self.zobrist ^= zobrist_key(HashFeature.HUNT_BOX_CHARACTER, character)
+        self._assign(self, "hunt_box_character", character)
+
+    def draw_hunt_tile(self) -> HuntTile:
+        tile = self.hunt_pool.draw()
+        self._record(lambda: self.hunt_pool.tiles.append(tile))
+        return tile
+
+    def reserve_hunt_tile(self, tile: HuntTile) -> None:
+        self.hunt_pool.reserve.append(tile)
+        self._record(lambda: self.hunt_pool.reserve.remove(tile))
+
+    def enter_mordor(self) -> None:
+        self._assign(self.hunt_pool, "tiles", list(self.hunt_pool.tiles))
+        self._assign(self.hunt_pool, "reserve", list(self.hunt_pool.reserve))
+        self.hunt_pool.enter_mordor(self.rng.hunt)
+        self.set_fellowship_location(None)
+        self.set_fellowship_progress(0)
+
+    def set_fellowship_location(self, location: Optional[Region]) -> None:
+        self.zobrist ^= self._location_hash(self.fellowship.location)
+        self.zobrist ^= self._location_hash(location)
+        self._assign(self.fellowship, "location", location)
+
+    def set_fellowship_progress(self, progress: int) -> None:
+        self.zobrist ^= zobrist_key(
+            HashFeature.FELLOWSHIP_PROGRESS, self.fellowship.progress
+        )
+        self.zobrist ^= zobrist_key(HashFeature.FELLOWSHIP_PROGRESS, progress)
+        self._assign(self.fellowship, "progress", progress)
+
+    def set_corruption(self, corruption: int) -> None:
+        self.zobrist ^= zobrist_key(
+            HashFeature.FELLOWSHIP_CORRUPTION, self.fellowship.corruption
+        )
+        self.zobrist ^= zobrist_key(HashFeature.FELLOWSHIP_CORRUPTION, corruption)
+        self._assign(self.fellowship, "corruption", corruption)
+
+    def set_revealed(self, revealed: bool) -> None:
+        self.zobrist ^= zobrist_key(
+            HashFeature.FELLOWSHIP_REVEALED, self.fellowship.revealed
+        )
+        self.zobrist ^= zobrist_key(HashFeature.FELLOWSHIP_REVEALED, revealed)
+        self._assign(self.fellowship, "revealed", revealed)
+
+    def set_guide(self, guide: Companion) -> None:
+        self._assign(self.fellowship, "guide", guide)
+
+    def remove_companion(self, companion: Companion) -> None:
+        companions = self.fellowship.companions
+        index = companions.index(companion)
+        del companions[index]
+        self._touch(Concern.CHARACTERS)
+        self._record(lambda: companions.insert(index, companion))
@@ -0,0 +1,167 @@
+"""Head-to-head matches between two strategies, stopped early with a sequential test.
+
+Strategy A plays strategy B with sides alternating every game, and each seed is played
+once with A as the Free Peoples and once with A as the Shadow. After every decisive
+game a sequential probability ratio test (SPRT) compares H0: A wins with probability
+p0, against H1: A wins with probability p0 + margin. The match stops as soon as either
+hypothesis is accepted, and reports how many of the maximum games were saved.
+Unfinished games count as neither a win nor a loss.
+
+Usage: wotr-match --a random --b random --margin 0.05 --max-games 10000 --seed 0
+"""
+import argparse
+import math
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from war_of_the_ring_ai.agent import STRATEGIES
+from war_of_the_ring_ai.game_objects import Side
+from war_of_the_ring_ai.game_random import GameRandom
+from war_of_the_ring_ai.simulate import new_game, play_game, unfinished_warning
+
+
+@dataclass(frozen=True, slots=True)
+class SPRT:
+    margin: float = 0.05
+    alpha: float = 0.05  # Probability of accepting H1 when H0 is true
+    beta: float = 0.05  # Probability of accepting H0 when H1 is true
+    p0: float = 0.5
+
+    def __post_init__(self) -> None:
+        if not 0 < self.p0 < self.p1 < 1:
+            raise ValueError(
+                f"Need 0 < p0 < p0 + margin < 1, got p0 {self.p0} and margin "
+                f"{self.margin}."
+            )
+        if not (0 < self.alpha < 1 and 0 < self.beta < 1):
+            raise ValueError(
+                f"Need alpha and beta between 0 and 1, got {self.alpha} and "
+                f"{self.beta}."
+            )
+
+    @property
+    def p1(self) -> float:
+        return self.p0 + self.margin
+
+    def bounds(self) -> tuple[float, float]:
+        return (
+            math.log(self.beta / (1 - self.alpha)),
+            math.log((1 - self.beta) / self.alpha),
+        )
+
+    def llr(self, wins: int, losses: int) -> float:
+        return wins * math.log(self.p1 / self.p0) + losses * math.log(
+            (1 - self.p1) / (1 - self.p0)
+        )
+
+    def decision(self, wins: int, losses: int) -> Optional[bool]:
+        # True if H1 is accepted, False if H0 is accepted, None to keep playing
+        lower, upper = self.bounds()
+        llr = self.llr(wins, losses)
+        if llr >= upper:
+            return True
+        if llr <= lower:
+            return False
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class MatchResult:
+    test: SPRT
+    wins: int
+    losses: int
+    unfinished: int
+    max_games: int
+    accepted: Optional[bool]
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.losses + self.unfinished
+
+    @property
+    def games_saved(self) -> int:
+        return self.max_games - self.games
+
+    def report(self) -> str:
+        warning = unfinished_warning(self.unfinished, self.games)
+        verdict = {
+            True: f"accepted: A beats B by at least {self.test.margin:.1%}",
+            False: f"rejected: A does not beat B by {self.test.margin:.1%}",
+            None: "inconclusive",
+        }[self.accepted]
+        return "\n".join(
+            ([] if warning is None else [warning])
+            + [
+                f"A wins {self.wins}, losses {self.losses}, "
+                f"unfinished {self.unfinished}",
+                f"LLR {self.test.llr(self.wins, self.losses):.3f}, "
+                f"bounds {self.test.bounds()[0]:.3f}, {self.test.bounds()[1]:.3f}",
+                f"Hypothesis {verdict}",
+                f"Games played: {self.games} of {self.max_games} "
+                f"({self.games_saved} saved)",
+            ]
+        )
+
+
+def run_sprt(
+    test: SPRT, outcomes: Iterable[Optional[bool]], max_games: int
+) -> MatchResult:
+    # Outcomes are True for a win by A, False for a loss and None for unfinished games
+    wins, losses, unfinished = 0, 0, 0
+    accepted = None
+    for outcome in outcomes:
+        if outcome is None:
+            unfinished += 1
+        elif outcome:
+            wins += 1
+        else:
+            losses += 1
+        if outcome is not None:
+            accepted = test.decision(wins, losses)
+        if accepted is not None or wins + losses + unfinished >= max_games:
+            break
+    return MatchResult(test, wins, losses, unfinished, max_games, accepted)
+
+
+def match_outcomes(
+    a: str, b: str, seed: Optional[int] = None
+) -> Iterator[Optional[bool]]:
+    seed = GameRandom(seed).seed
+    # A plays the Free Peoples in the first state, and the Shadow in the second
+    states = new_game(a, b, seed), new_game(b, a, seed)
+    game = 0
+    while True:
+        for a_side, state in zip(Side, states):
+            state.reset(seed, game)
+            result = play_game(state)
+            yield None if result.winner is None else result.winner == a_side
+        game += 1
+
+
+def play_match(
+    a: str, b: str, test: SPRT, max_games: int, seed: Optional[int] = None
+) -> MatchResult:
+    return run_sprt(test, match_outcomes(a, b, seed), max_games)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="wotr-match", description="Play A against B until an SPRT decides."
+    )
+    parser.add_argument("--a", choices=STRATEGIES, default="random")
+    parser.add_argument("--b", choices=STRATEGIES, default="random")
+    parser.add_argument("--margin", type=float, default=0.05)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--beta", type=float, default=0.05)
+    parser.add_argument("--max-games", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    try:
+        test = SPRT(args.margin, args.alpha, args.beta)
+    except ValueError as error:
+        parser.error(str(error))
+    print(play_match(args.a, args.b, test, args.max_games, args.seed).report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""Headless batch simulation of games between agents.
+
+Runs games back to back on a single reused GameState, with no per-decision output,
+and reports throughput: games per second, decisions per second and mean game length.
+Per-game results can optionally be written to a file as JSON lines, and every decision
+to a decision log. With --threads, games are shared out between threads in one process,
+each reusing its own GameState, with the same results as a sequential run.
+
+Usage: wotr-sim --games 1000 --free random --shadow random --seed 0 --output out.jsonl
+"""
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Iterable, Iterator, Optional, TextIO
+
+from war_of_the_ring_ai.agent import STRATEGIES, Agent, NoValidOptions
+from war_of_the_ring_ai.decision_log import DecisionLog
+from war_of_the_ring_ai.game_manager import GameManager
+from war_of_the_ring_ai.game_objects import Side
+from war_of_the_ring_ai.game_random import GameRandom
+from war_of_the_ring_ai.game_state import GameState
+
+# Parts of the rules are not implemented yet, and games that reach them end early. A
+# missing rule can also leave a player with no legal choice. Any other exception is a
+# bug in the engine, and is raised.
+UNFINISHED_GAME_ERRORS = (NotImplementedError, NoValidOptions)
+
+
+def unfinished_warning(unfinished: int, games: int) -> Optional[str]:
+    if unfinished == 0:
+        return None
+    finished = "none did" if unfinished == games else "only those that did count"
+    return (
+        f"Warning: {unfinished} of {games} games reached unimplemented rules and "
+        f"ended without a winner. Results need finished games, and {finished}."
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class GameResult:
+    seed: int
+    game: int
+    winner: Optional[Side]
+    turns: int
+    decisions: int
+    seconds: float
+    error: Optional[str] = None
+
+    def to_json(self) -> str:
+        result = asdict(self)
+        result["winner"] = None if self.winner is None else self.winner.name
+        return json.dumps(result)
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationSummary:
+    games: int
+    unfinished: int
+    wins: dict[Side, int]
+    seconds: float
+    games_per_second: float
+    decisions_per_second: float
+    mean_turns: float
+    mean_decisions: float
+
+    def report(self) -> str:
+        warning = unfinished_warning(self.unfinished, self.games)
+        return "\n".join(
+            ([] if warning is None else [warning])
+            + [
+                f"Games: {self.games} ({self.unfinished} unfinished)",
+                f"Wins: {', '.join(f'{s.name} {n}' for s, n in self.wins.items())}",
+                f"Time: {self.seconds:.2f} s",
+                f"Games/s: {self.games_per_second:.1f}",
+                f"Decisions/s: {self.decisions_per_second:.0f}",
+                f"Mean game length: {self.mean_turns:.1f} turns, "
+                f"{self.mean_decisions:.1f} decisions",
+            ]
+        )
+
+
+def play_game(state: GameState) -> GameResult:
+    manager = GameManager(state)
+    decisions = sum(player.agent.decisions for player in state.players)
+    winner, error = None, None
+    start = time.perf_counter()
+    try:
+        winner = manager.play()
+    except UNFINISHED_GAME_ERRORS as exception:
+        error = f"{type(exception).__name__}: {exception}"
+    seconds = time.perf_counter() - start
+    decisions = sum(player.agent.decisions for player in state.players) - decisions
+    return GameResult(
+        state.rng.seed, state.rng.game, winner, manager.turns, decisions, seconds, error
+    )
+
+
+def new_game(
+    free: str, shadow: str, seed: Optional[int], log: Optional[DecisionLog] = None
+) -> GameState:
+    state = GameState(rng=GameRandom(seed))
+    state.free_player.agent = Agent(
+        Side.FREE.name, STRATEGIES[free], log, state.rng.agents
+    )
+    state.shadow_player.agent = Agent(
+        Side.SHADOW.name, STRATEGIES[shadow], log, state.rng.agents
+    )
+    return state
+
+
+def simulate(
+    games: int,
+    free: str = "random",
+    shadow: str = "random",
+    seed: Optional[int] = None,
+    log: Optional[DecisionLog] = None,
+) -> Iterator[GameResult]:
+    # Every game is seeded from (seed, game), so it can be replayed on its own
+    state = new_game(free, shadow, seed, log)
+    for game in range(games):
+        if game > 0:
+            state.reset(state.rng.seed, game)
+        yield play_game(state)
+
+
+def simulate_threaded(
+    games: int,
+    free: str = "random",
+    shadow: str = "random",
+    seed: Optional[int] = None,
+    threads: int = 4,
+) -> Iterator[GameResult]:
+    # Results are yielded in game order, and match those of simulate with the same seed
+    seed = GameRandom(seed).seed
+    local = threading.local()
+
+    def play(game: int) -> GameResult:
+        state: Optional[GameState] = getattr(local, "state", None)
+        if state is None:
+            state = local.state = new_game(free, shadow, seed)
+        state.reset(seed, game)
+        return play_game(state)
+
+    with ThreadPoolExecutor(threads) as executor:
+        yield from executor.map(play, range(games))
+
+
+def replay(
+    seed: int, game: int, free: str = "random", shadow: str = "random"
+) -> GameResult:
+    state = new_game(free, shadow, seed)
+    state.reset(seed, game)
+    return play_game(state)
+
+
+def summarize(results: Iterable[GameResult], seconds: float) -> SimulationSummary:
+    results = list(results)
+    games = len(results)
+    decisions = sum(result.decisions for result in results)
+    wins = {side: 0 for side in Side}
+    for result in results:
+        if result.winner is not None:
+            wins[result.winner] += 1
+    return SimulationSummary(
+        games,
+        sum(1 for result in results if result.winner is None),
+        wins,
+        seconds,
+        games / seconds if seconds else 0.0,
+        decisions / seconds if seconds else 0.0,
+        sum(result.turns for result in results) / games if games else 0.0,
+        decisions / games if games else 0.0,
+    )
+
+
+def run(
+    games: int,
+    free: str = "random",
+    shadow: str = "random",
+    seed: Optional[int] = None,
+    output: Optional[TextIO] = None,
+    log: Optional[DecisionLog] = None,
+    threads: int = 1,
+) -> SimulationSummary:
+    results = []
+    start = time.perf_counter()
+    if threads > 1:
+        simulation = simulate_threaded(games, free, shadow, seed, threads)
+    else:
+        simulation = simulate(games, free, shadow, seed, log)
+    for result in simulation:
+        results.append(result)
+        if output is not None:
+            output.write(result.to_json() + "\n")
+    if log is not None:
+        log.flush()
+    return summarize(results, time.perf_counter() - start)
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="wotr-sim", description="Run headless games and report throughput."
+    )
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--free", choices=STRATEGIES, default="random")
+    parser.add_argument("--shadow", choices=STRATEGIES, default="random")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument(
+        "--output", type=argparse.FileType("w"), help="write results as JSON lines"
+    )
+    parser.add_argument(
+        "--decisions", type=argparse.FileType("w"), help="write every decision made"
+    )
+    args = parser.parse_args(argv)
+    if args.decisions is not None and args.threads > 1:
+        parser.error("--decisions cannot be combined with --threads")
+    return args
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    log = None if args.decisions is None else DecisionLog(sink=args.decisions)
+    try:
+        summary = run(
+            args.games,
+            args.free,
+            args.shadow,
+            args.seed,
+            args.output,
+            log,
+            args.threads,
+        )
+    finally:
+        for file in (args.output, args.decisions):
+            if file is not None:
+                file.close()
+    print(summary.report())
+
+
+if __name__ == "__main__":
+    main()
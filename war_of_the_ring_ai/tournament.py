@@ -0,0 +1,193 @@
+"""Agent-vs-agent tournaments played on a process pool.
+
+Each pairing assigns a strategy to each side. Games are split into batches and shared
+out between worker processes, which keep one GameState per pairing and reset it from
+(seed, game) before every game, so every game can be replayed on its own. Every pairing
+plays the same seeds. Results are streamed back as batches finish, and standings report
+each side's win rate with a Wilson score confidence interval.
+
+Usage: wotr-tournament --pairing random:random --games 10000 --seed 0 --workers 8
+"""
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+from war_of_the_ring_ai.agent import STRATEGIES
+from war_of_the_ring_ai.game_objects import Side
+from war_of_the_ring_ai.game_random import GameRandom
+from war_of_the_ring_ai.game_state import GameState
+from war_of_the_ring_ai.simulate import (
+    GameResult,
+    new_game,
+    play_game,
+    unfinished_warning,
+)
+
+# Each worker gets several batches of a pairing so that the last ones even out across
+# workers. Batches are capped so that results stream back steadily, and at that size
+# inter-process traffic is negligible next to playing the games.
+BATCHES_PER_WORKER = 4
+MAX_BATCH_SIZE = 64
+
+# Standard normal quantile for a 95% confidence interval
+Z_95 = 1.959964
+
+
+@dataclass(frozen=True, slots=True)
+class Pairing:
+    free: str
+    shadow: str
+
+    def __str__(self) -> str:
+        return f"{self.free}:{self.shadow}"
+
+    @staticmethod
+    def parse(pairing: str) -> "Pairing":
+        free, _, shadow = pairing.partition(":")
+        return Pairing(free, shadow or free)
+
+
+def wilson_interval(
+    successes: int, trials: int, z: float = Z_95
+) -> tuple[float, float]:
+    if trials == 0:
+        return 0.0, 1.0
+    rate = successes / trials
+    denominator = 1 + z * z / trials
+    center = (rate + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / trials + z * z / (4 * trials**2))
+    margin /= denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+@dataclass(slots=True)
+class Standings:
+    pairing: Pairing
+    games: int = 0
+    unfinished: int = 0
+    wins: dict[Side, int] = field(default_factory=lambda: {side: 0 for side in Side})
+
+    def add(self, result: GameResult) -> None:
+        self.games += 1
+        if result.winner is None:
+            self.unfinished += 1
+        else:
+            self.wins[result.winner] += 1
+
+    def win_rate(self, side: Side) -> float:
+        finished = self.games - self.unfinished
+        return self.wins[side] / finished if finished else 0.0
+
+    def confidence_interval(self, side: Side) -> tuple[float, float]:
+        return wilson_interval(self.wins[side], self.games - self.unfinished)
+
+    def report(self) -> str:
+        rates = []
+        for side in Side:
+            low, high = self.confidence_interval(side)
+            rates.append(
+                f"{side.name} {self.win_rate(side):.1%} [{low:.1%}, {high:.1%}]"
+            )
+        report = (
+            f"{self.pairing}: {self.games} games ({self.unfinished} unfinished), "
+            + ", ".join(rates)
+        )
+        warning = unfinished_warning(self.unfinished, self.games)
+        return report if warning is None else f"{report}\n  {warning}"
+
+
+# Worker processes keep one state per pairing, reset before every game
+_STATES: dict[Pairing, GameState] = {}
+
+
+def play_batch(pairing: Pairing, seed: int, games: range) -> list[GameResult]:
+    state = _STATES.get(pairing)
+    if state is None:
+        state = _STATES[pairing] = new_game(pairing.free, pairing.shadow, seed)
+    results = []
+    for game in games:
+        state.reset(seed, game)
+        results.append(play_game(state))
+    return results
+
+
+def batch_size(games: int, workers: Optional[int] = None) -> int:
+    workers = workers or os.cpu_count() or 1
+    return max(
+        1, min(MAX_BATCH_SIZE, math.ceil(games / (workers * BATCHES_PER_WORKER)))
+    )
+
+
+def play_tournament(
+    pairings: Iterable[Pairing],
+    games: int,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> Iterator[tuple[Pairing, GameResult]]:
+    # Results are yielded as soon as each batch finishes, in no particular order
+    seed = GameRandom(seed).seed
+    size = batch_size(games, workers)
+    with ProcessPoolExecutor(workers) as executor:
+        futures = {
+            executor.submit(
+                play_batch, pairing, seed, range(start, min(start + size, games))
+            ): pairing
+            for pairing in pairings
+            for start in range(0, games, size)
+        }
+        for future in as_completed(futures):
+            for result in future.result():
+                yield futures[future], result
+
+
+def run(
+    pairings: list[Pairing],
+    games: int,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> dict[Pairing, Standings]:
+    standings = {pairing: Standings(pairing) for pairing in pairings}
+    for pairing, result in play_tournament(pairings, games, seed, workers):
+        standings[pairing].add(result)
+    return standings
+
+
+def parse_pairing(pairing: str) -> Pairing:
+    parsed = Pairing.parse(pairing)
+    for strategy in (parsed.free, parsed.shadow):
+        if strategy not in STRATEGIES:
+            raise argparse.ArgumentTypeError(f"Unknown strategy: {strategy}")
+    return parsed
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="wotr-tournament", description="Play agent pairings on a process pool."
+    )
+    parser.add_argument(
+        "--pairing",
+        type=parse_pairing,
+        action="append",
+        help="FREE:SHADOW strategies, may be repeated (default random:random)",
+    )
+    parser.add_argument("--games", type=int, default=1000, help="games per pairing")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    pairings = args.pairing or [Pairing("random", "random")]
+    start = time.perf_counter()
+    standings = run(pairings, args.games, args.seed, args.workers)
+    seconds = time.perf_counter() - start
+    for pairing in pairings:
+        print(standings[pairing].report())
+    total = sum(standing.games for standing in standings.values())
+    print(f"{total} games in {seconds:.2f} s ({total / seconds:.1f} games/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class TranspositionEntry(Generic[T]):
+    value: T
+    depth: int
+
+
+# Bounded map from GameState Zobrist hashes to search results. When full, the least
+# recently used entry is evicted. An entry for a position that is already stored is
+# only replaced by one searched to at least the same depth.
+class TranspositionTable(Generic[T]):
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("Transposition table capacity must be positive.")
+        self.capacity: int = capacity
+        self.entries: OrderedDict[int, TranspositionEntry[T]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self.entries
+
+    def lookup(self, key: int, depth: int = 0) -> Optional[T]:
+        entry = self.entries.get(key)
+        if entry is None or entry.depth < depth:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def store(self, key: int, value: T, depth: int = 0) -> None:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            if entry.depth <= depth:
+                entry.value = value
+                entry.depth = depth
+            return
+        if len(self.entries) >= self.capacity:
+            self.entries.popitem(last=False)
+        self.entries[key] = TranspositionEntry(value, depth)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,53 @@
+# Measurements of engine resource usage, to be tracked over time
+import gc
+import timeit
+import tracemalloc
+from copy import deepcopy
+
+from war_of_the_ring_ai.game_state import GameState
+
+
+def game_state_memory(samples: int = 10) -> int:
+    # Average bytes retained by a new GameState. One state is created up front so that
+    # one-time allocations are not counted.
+    GameState()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        states = [GameState() for _ in range(samples)]
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return retained // len(states)
+
+
+def clone_time(samples: int = 1000) -> tuple[float, float]:
+    # Average seconds to copy a GameState with GameState.clone and with deepcopy
+    state = GameState()
+    clone_seconds = timeit.timeit(state.clone, number=samples) / samples
+    deepcopy_seconds = timeit.timeit(lambda: deepcopy(state), number=samples) / samples
+    return clone_seconds, deepcopy_seconds
+
+
+def reset_time(samples: int = 1000) -> tuple[float, float]:
+    # Average seconds to start a game with GameState.reset and with a new GameState
+    state = GameState()
+    reset_seconds = timeit.timeit(state.reset, number=samples) / samples
+    create_seconds = timeit.timeit(GameState, number=samples) / samples
+    return reset_seconds, create_seconds
+
+
+def main() -> None:
+    print(f"GameState memory footprint: {game_state_memory()} bytes")
+    clone_seconds, deepcopy_seconds = clone_time()
+    print(f"GameState.clone: {clone_seconds * 1e6:.1f} us")
+    print(f"deepcopy(GameState): {deepcopy_seconds * 1e6:.1f} us")
+    print(f"Clone speedup: {deepcopy_seconds / clone_seconds:.1f}x")
+    reset_seconds, create_seconds = reset_time()
+    print(f"GameState.reset: {reset_seconds * 1e6:.1f} us")
+    print(f"GameState(): {create_seconds * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
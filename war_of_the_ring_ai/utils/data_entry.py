@@ -1,10 +1,13 @@
 """Interactive workflow script to perform data entry for the region map."""
 import csv
+from pathlib import Path
 
-OUTFILE = "data/worldmap.csv"
+# Data entry edits the sources in a checkout, so it needs their path on disk
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+OUTFILE = DATA_DIR / "worldmap.csv"
 DELIMITER = "|"
 
-with open("data/alphabetical.txt", encoding="utf8") as f:
+with open(DATA_DIR / "alphabetical.txt", encoding="utf8") as f:
     REGIONS = {region.strip() for region in f.readlines()}
 
 NATIONS = {
@@ -0,0 +1,45 @@
+from enum import Enum
+from functools import cache
+
+MASK_64 = (1 << 64) - 1
+FEATURE_BITS = 4
+COUNT_BITS = 2
+INDEX_BITS = 10
+MAX_INDEXES = (1 << COUNT_BITS) - 1
+
+
+class HashFeature(Enum):
+    UNITS = 0
+    CHARACTER = 1
+    CONQUERED = 2
+    FELLOWSHIP_LOCATION = 3
+    FELLOWSHIP_PROGRESS = 4
+    FELLOWSHIP_CORRUPTION = 5
+    FELLOWSHIP_REVEALED = 6
+    POLITICS = 7
+    DICE = 8
+    HUNT_BOX_EYES = 9
+    HUNT_BOX_CHARACTER = 10
+
+
+@cache
+def zobrist_key(feature: HashFeature, *indexes: int) -> int:
+    # Keys are derived by scrambling the feature and its indexes with splitmix64, rather
+    # than drawn from a random table, so they are identical in every process and need
+    # no table sized for the largest possible unit count or track position. The feature,
+    # the number of indexes and each index have their own bit field, so every distinct
+    # input gives a distinct seed, and splitmix64 maps distinct seeds to distinct keys.
+    # An index of -1 fills its field, above any real index.
+    if len(indexes) > MAX_INDEXES:
+        raise ValueError(f"At most {MAX_INDEXES} indexes can be hashed.")
+    seed = feature.value | (len(indexes) << FEATURE_BITS)
+    shift = FEATURE_BITS + COUNT_BITS
+    for index in indexes:
+        if not -1 <= index < (1 << INDEX_BITS) - 1:
+            raise ValueError(f"Index {index} does not fit in {INDEX_BITS} bits.")
+        seed |= (index & ((1 << INDEX_BITS) - 1)) << shift
+        shift += INDEX_BITS
+    key = (seed * 0x9E3779B97F4A7C15) & MASK_64
+    key = ((key ^ (key >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return key ^ (key >> 31)